@@ -16,9 +16,13 @@
 #        - Log panel + status bar 연동
 # ============================================================
 
+import functools
+import hashlib
 import json
 import os
+import queue
 import re
+import threading
 import time
 import traceback
 from pathlib import Path
@@ -27,6 +31,16 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 from tkinter.scrolledtext import ScrolledText
 
+try:
+    import orjson  # optional: faster JSON load/save
+except ImportError:
+    orjson = None
+
+try:
+    import ujson  # optional: fallback when orjson is unavailable
+except ImportError:
+    ujson = None
+
 # ------------------------------------------------------------
 # Paths / Constants
 # ------------------------------------------------------------
@@ -38,6 +52,8 @@ UI_STATE_PATH = BASE_DIR / "ui_state.json"
 ISSUES_PATH = BASE_DIR / "issues_config.json"
 
 PLACEHOLDER_RE = re.compile(r"\{([A-Za-z0-9_]+)\}")
+PLACEHOLDER_NAME_RE = re.compile(r"[A-Za-z0-9_]+")  # PLACEHOLDER_RE가 잡는 이름 (fullmatch 용)
+BRACE_TOKEN_RE = re.compile(r"\{([^{}]+)\}")  # 모든 {name} 토큰 (한글/'-' 등 포함 param 이름 참조 검사용)
 DEFAULT_GEOMETRY = "1280x800"
 
 # Keyword list view: Summary | Group | Info | Copy | CopyNP | Preview
@@ -50,38 +66,110 @@ DEFAULT_KEYWORD_COL_WIDTHS = {
     "copynp": 90,
     "preview": 560,
 }
+# 저장/복원 가능한 keyword column (width 기본값이 있고 실제 tree column인 것)
+KEYWORD_WIDTH_COLS = frozenset(DEFAULT_KEYWORD_COL_WIDTHS).intersection(KEYWORD_COLS)
+
+# Keyword tree identify_column() ids: #0 checkbox, #3 Info, #4 Copy, #5 CopyNP
+COL_CHECK, COL_INFO, COL_COPY, COL_COPYNP = "#0", "#3", "#4", "#5"
+KEYWORD_ACTION_COLS = frozenset((COL_CHECK, COL_INFO, COL_COPY, COL_COPYNP))
 
 PARAM_COLS = ("pname", "pval")
 DEFAULT_PARAM_COL_WIDTHS = {"pname": 140, "pval": 280}
 
 COPY_FEEDBACK_MS = 900
+PERSIST_FLUSH_DELAY_MS = 200
+WRITER_POLL_MS = 250
+JOIN_CACHE_MAX = 8192  # _kw_joined entry 상한 (넘으면 통째로 비움: 삭제된 kw 참조 누적 방지)
 DEFAULT_DELIMITER = ";"
 
 # KeywordDialog UI
 PREVIEW_MAX_LINES = 4
 PARTS_AREA_HEIGHT_PX = 160
+PREVIEW_DEBOUNCE_MS = 80
 
 # Description Rich tags
 DESC_COLOR_KEYS = ("black", "red", "blue")
+DESC_COLOR_TAGS = {c: f"c_{c}" for c in DESC_COLOR_KEYS}  # color -> Text tag name (membership + tag 조회 1회)
+
+# InfoPopup: 긴 description은 chunk 단위로 나눠 idle 시 순차 insert (popup 즉시 표시)
+INFO_DESC_CHUNK_CHARS = 4000
+INFO_DESC_FILL_MS = 1
 
 # Export schema
 EXPORT_SCHEMA_VERSION = "1.0"
 
 
+# ------------------------------------------------------------
+# JSON encode / decode (orjson -> ujson -> stdlib fallback chain)
+# ------------------------------------------------------------
+def _json_dumps_bytes(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if ujson is not None:
+        return ujson.dumps(data, indent=2, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _json_member_bytes(key: str, value) -> bytes:
+    """top-level object의 한 member('  "key": value')를 indent 2 기준으로 직렬화"""
+    return b"  " + _json_dumps_bytes(str(key)) + b": " + _json_dumps_bytes(value).replace(b"\n", b"\n  ")
+
+
+def _json_object_from_members(members) -> bytes:
+    """_json_member_bytes 조각들을 조립 -> _json_dumps_bytes(전체 dict)와 byte 동일"""
+    members = list(members)
+    if not members:
+        return b"{}"
+    return b"{\n" + b",\n".join(members) + b"\n}"
+
+
+def _json_loads_bytes(raw: bytes):
+    # orjson / ujson은 bytes를 직접 parse (str decode 복사 생략)
+    if orjson is not None:
+        return orjson.loads(raw)
+    if ujson is not None:
+        return ujson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
 # ------------------------------------------------------------
 # Robust Save (WinError 5 mitigation)
 # ------------------------------------------------------------
-def _safe_write_json(path: Path, data: dict, retries: int = 7, base_sleep: float = 0.06) -> tuple[bool, str]:
+# path -> (size, blake2b digest, st_mtime_ns): 마지막으로 읽었거나 쓴 파일 내용 (mtime이 바뀌면 무효)
+_last_written_sig: dict[str, tuple[int, bytes, int]] = {}
+
+
+def _content_sig(raw: bytes) -> tuple[int, bytes]:
+    return len(raw), hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _remember_file_sig(path: Path, raw: bytes):
+    try:
+        _last_written_sig[str(path)] = _content_sig(raw) + (path.stat().st_mtime_ns,)
+    except OSError:
+        _last_written_sig.pop(str(path), None)
+
+
+def _file_matches_sig(path: Path, sig: tuple[int, bytes]) -> bool:
+    prev = _last_written_sig.get(str(path))
+    if prev is None or prev[:2] != sig:
+        return False
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    return st.st_size == prev[0] and st.st_mtime_ns == prev[2]
+
+
+def _safe_write_bytes(path: Path, txt: bytes, retries: int = 7, base_sleep: float = 0.06) -> tuple[bool, str]:
     """
     Windows 환경에서 간헐적으로 발생하는 PermissionError(WinError 5) 대응:
     - tmp 파일에 쓰고 os.replace로 원자 교체
     - retry/backoff
     - 실패 시 autosave 파일로 fallback
     """
-    try:
-        txt = json.dumps(data, indent=2, ensure_ascii=False)
-    except Exception as e:
-        return False, f"json.dumps failed: {e}"
+    if _file_matches_sig(path, _content_sig(txt)):
+        return True, "Unchanged"
 
     tmp = path.with_suffix(path.suffix + ".tmp")
     autosave = path.with_suffix(path.suffix + f".autosave_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
@@ -89,8 +177,12 @@ def _safe_write_json(path: Path, data: dict, retries: int = 7, base_sleep: float
     last_err = None
     for n in range(retries):
         try:
-            tmp.write_text(txt, encoding="utf-8")
+            with open(tmp, "wb") as f:
+                f.write(txt)
+                f.flush()
+                os.fsync(f.fileno())  # replace 전에 내용을 disk에 확정 (전원 차단 시 빈/잘린 파일 방지)
             os.replace(str(tmp), str(path))
+            _remember_file_sig(path, txt)
             return True, "OK"
         except PermissionError as e:
             last_err = e
@@ -102,7 +194,7 @@ def _safe_write_json(path: Path, data: dict, retries: int = 7, base_sleep: float
             continue
 
     try:
-        autosave.write_text(txt, encoding="utf-8")
+        autosave.write_bytes(txt)
         return False, f"Primary save failed ({last_err}); wrote fallback: {autosave.name}"
     except Exception as e:
         return False, f"Primary save failed ({last_err}); autosave failed ({e})"
@@ -115,40 +207,94 @@ def load_json(path: Path):
     if not path.exists():
         return {}
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return data if isinstance(data, dict) else {}
+        raw = path.read_bytes()
+        data = _json_loads_bytes(raw)
+        if not isinstance(data, dict):
+            return {}
+        # 읽은 내용 기록 -> 변경 없이 다시 save하면 write skip
+        _remember_file_sig(path, raw)
+        return data
     except Exception:
         return {}
 
 
-def save_json(path: Path, data: dict) -> tuple[bool, str]:
-    return _safe_write_json(path, data)
+def save_json_bytes(path: Path, payload: bytes) -> tuple[bool, str]:
+    return _safe_write_bytes(path, payload)
+
+
+@functools.lru_cache(maxsize=4096)
+def _detect_placeholders_cached(text: str) -> tuple:
+    # findall + dict.fromkeys: 순서 유지 dedupe
+    return tuple(dict.fromkeys(PLACEHOLDER_RE.findall(text)))
 
 
 def detect_placeholders(text: str):
-    seen, ordered = set(), []
-    for m in PLACEHOLDER_RE.finditer(text or ""):
-        name = m.group(1)
-        if name not in seen:
-            seen.add(name)
-            ordered.append(name)
-    return ordered
-
-
-def render_keyword(template: str, params: dict):
-    """placeholder를 params 값으로 치환"""
-    out = template or ""
-    params = params or {}
-    for k, v in params.items():
-        out = out.replace("{" + str(k) + "}", str(v))
+    if not text or "{" not in text:
+        return []
+    return list(_detect_placeholders_cached(text))
+
+
+@functools.lru_cache(maxsize=4096)
+def _template_chunks(template: str) -> tuple:
+    """template -> (literals, names): PLACEHOLDER_RE.split 1회 결과 캐시 (len(literals) == len(names) + 1)"""
+    parts = PLACEHOLDER_RE.split(template)
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
+
+def params_cache_key(params: dict) -> tuple:
+    """render cache key: params를 (str(k), str(v)) 정렬 tuple로 고정 (refresh 1회당 1번만 계산)"""
+    return tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+
+
+def _render_str_params(template: str, params_str: dict, extra: tuple = ()) -> str:
+    """placeholder를 params_str({str: str}) 값으로 치환 (정의되지 않은 placeholder는 그대로 유지) — 유일한 치환 경로
+
+    extra: PLACEHOLDER_RE로 split되지 않는 이름의 (name, value) -> 기존처럼 "{name}" str.replace로 치환
+    """
+    if not template:
+        return ""
+    if not params_str or "{" not in template:
+        return template
+
+    literals, names = _template_chunks(template)
+    out = [literals[0]]
+    for name, lit in zip(names, literals[1:]):
+        v = params_str.get(name)
+        out.append("{" + name + "}" if v is None else v)
+        out.append(lit)
+    out = "".join(out)
+    for name, v in extra:
+        token = "{" + name + "}"
+        if token in out:
+            out = out.replace(token, v)
     return out
 
 
+@functools.lru_cache(maxsize=16)
+def _params_str_dict(params_key: tuple) -> dict:
+    # params_key -> {str: str} 1회 변환 후 공유 (read-only로만 사용)
+    return dict(params_key)
+
+
+@functools.lru_cache(maxsize=16)
+def _params_extra_pairs(params_key: tuple) -> tuple:
+    # 한글/'-'/공백 등 PLACEHOLDER_RE 밖의 param 이름 -> str.replace fallback 대상
+    return tuple((k, v) for k, v in params_key if not PLACEHOLDER_NAME_RE.fullmatch(k))
+
+
+@functools.lru_cache(maxsize=1024)
+def render_keyword_cached(template: str, params_key: tuple) -> str:
+    """placeholder 치환 public API: (template, params_cache_key(params))로 memoize — key가 내용 기반이라 별도 invalidate 불필요"""
+    return _render_str_params(template, _params_str_dict(params_key), _params_extra_pairs(params_key))
+
+
 def render_keyword_without_params(template: str):
     """placeholder는 제거(빈값) 처리: {CH} -> "" """
     if not template:
         return ""
-    return PLACEHOLDER_RE.sub("", template)
+    if "{" not in template:
+        return template
+    return "".join(_template_chunks(template)[0])
 
 
 def default_issues():
@@ -156,12 +302,7 @@ def default_issues():
 
 
 def _clean_str_list_keep_order(items):
-    out = []
-    for it in items or []:
-        s = str(it).strip()
-        if s:
-            out.append(s)
-    return out
+    return [s for s in (str(it).strip() for it in items or ()) if s]
 
 
 def ensure_issue_config_vendor_scoped(cfg: dict, vendors: list[str]):
@@ -200,19 +341,14 @@ def ensure_issue_config_vendor_scoped(cfg: dict, vendors: list[str]):
         if not isinstance(issues, list) or not issues:
             vobj["issues"] = default_issues()
         else:
-            seen = set()
-            cleaned = []
-            for it in issues:
-                s = str(it).strip()
-                if not s or s in seen:
-                    continue
-                seen.add(s)
-                cleaned.append(s)
-            vobj["issues"] = cleaned if cleaned else default_issues()
+            # strip/dedup/empty 제거를 C-level map/dict.fromkeys/filter로 처리, 이미 canonical이면 list 유지
+            cleaned = list(filter(None, dict.fromkeys(map(str.strip, map(str, issues)))))
+            if cleaned != issues:
+                vobj["issues"] = cleaned if cleaned else default_issues()
 
-        delim = vobj.get("delimiter", DEFAULT_DELIMITER)
-        delim = str(delim) if delim is not None else DEFAULT_DELIMITER
-        vobj["delimiter"] = delim
+        delim = vobj.get("delimiter")
+        if not isinstance(delim, str):
+            vobj["delimiter"] = str(delim) if delim is not None else DEFAULT_DELIMITER
 
     return cfg
 
@@ -220,13 +356,94 @@ def ensure_issue_config_vendor_scoped(cfg: dict, vendors: list[str]):
 def _desc_plain_from_rich(runs):
     if not isinstance(runs, list):
         return ""
-    out = []
+    # list comprehension 전달 (str.join은 generator도 내부에서 list로 materialize)
+    return "".join([str(r["text"]) for r in runs if isinstance(r, dict) and r.get("text")])
+
+
+def _desc_rich_insert_args(runs) -> list:
+    """rich runs -> Text.insert(index, chars1, tags1, chars2, tags2, ...) 인자 (insert 1회로 전체 적용)"""
+    args = []
+    if not isinstance(runs, list):
+        return args
     for r in runs:
-        if isinstance(r, dict):
-            t = r.get("text", "")
-            if t:
-                out.append(str(t))
-    return "".join(out)
+        if not isinstance(r, dict):
+            continue
+        t = str(r.get("text", ""))
+        if not t:
+            continue
+        tags = ("b",) if r.get("b") else ()
+        c = r.get("c", "black")
+        ctag = DESC_COLOR_TAGS.get(c) if isinstance(c, str) else None
+        if ctag:
+            tags += (ctag,)
+        args.append(t)
+        args.append(tags)
+    return args
+
+
+def _chunk_insert_args(args: list, budget: int) -> list[list]:
+    """_desc_rich_insert_args 결과를 chunk당 최대 budget 글자로 분할 (긴 run은 중간에서 자름)"""
+    chunks = []
+    cur = []
+    room = budget
+    for k in range(0, len(args) - 1, 2):
+        t, tags = args[k], args[k + 1]
+        while t:
+            piece, t = t[:room], t[room:]
+            cur.append(piece)
+            cur.append(tags)
+            room -= len(piece)
+            if room <= 0:
+                chunks.append(cur)
+                cur = []
+                room = budget
+    if cur:
+        chunks.append(cur)
+    return chunks
+
+
+def _clean_str(v) -> str:
+    # 대부분 이미 str -> str() 호출 생략
+    return v.strip() if type(v) is str else str(v).strip()
+
+
+def _kw_from_str(item: str):
+    t = item.strip()
+    if not t:
+        return None
+    return {"text": t, "summary": "", "group": "", "desc": ""}
+
+
+def _kw_from_dict(item: dict):
+    summary = _clean_str(item.get("summary", ""))
+    group = _clean_str(item.get("group", ""))
+
+    desc_rich = item.get("desc_rich", None)
+    has_rich = isinstance(desc_rich, list) and bool(desc_rich)
+    desc = _clean_str(item["desc"] if "desc" in item else item.get("description", ""))
+    if has_rich and not desc:
+        desc = _desc_plain_from_rich(desc_rich).strip()
+
+    parts = item.get("parts")
+    if isinstance(parts, list):
+        parts = _clean_str_list_keep_order(parts)
+        if parts:
+            kw = {"parts": parts, "summary": summary, "group": group, "desc": desc}
+            if has_rich:
+                kw["desc_rich"] = desc_rich
+            return kw
+
+    text = _clean_str(item.get("text", ""))
+    if not text:
+        return None
+    kw = {"text": text, "summary": summary, "group": group, "desc": desc}
+    if has_rich:
+        kw["desc_rich"] = desc_rich
+    return kw
+
+
+# type(item) -> normalizer (str: legacy plain text, dict: legacy/new keyword obj)
+_KW_NORMALIZERS = {str: _kw_from_str, dict: _kw_from_dict}
 
 
 def normalize_keywords(lst):
@@ -236,48 +453,29 @@ def normalize_keywords(lst):
       new:    {"summary":..., "group":..., "desc":..., "desc_rich":[...], "parts":[...]}
     """
     out = []
-    for item in lst or []:
-        if isinstance(item, str):
-            t = item.strip()
-            if t:
-                out.append({"text": t, "summary": "", "group": "", "desc": ""})
+    for item in lst or ():
+        handler = _KW_NORMALIZERS.get(type(item))
+        if handler is None:
             continue
-
-        if not isinstance(item, dict):
-            continue
-
-        summary = str(item.get("summary", "")).strip()
-        group = str(item.get("group", "")).strip()
-
-        desc_rich = item.get("desc_rich", None)
-        desc = str(item.get("desc", item.get("description", ""))).strip()
-        if isinstance(desc_rich, list) and desc_rich and not desc:
-            desc = _desc_plain_from_rich(desc_rich).strip()
-
-        if "parts" in item and isinstance(item.get("parts"), list):
-            parts = _clean_str_list_keep_order(item.get("parts"))
-            if parts:
-                kw = {"parts": parts, "summary": summary, "group": group, "desc": desc}
-                if isinstance(desc_rich, list) and desc_rich:
-                    kw["desc_rich"] = desc_rich
-                out.append(kw)
-                continue
-
-        text = str(item.get("text", "")).strip()
-        if text:
-            kw = {"text": text, "summary": summary, "group": group, "desc": desc}
-            if isinstance(desc_rich, list) and desc_rich:
-                kw["desc_rich"] = desc_rich
+        kw = handler(item)
+        if kw is not None:
             out.append(kw)
-
     return out
 
 
+@functools.lru_cache(maxsize=4096)
+def _join_parts_cached(parts: tuple, delimiter: str) -> str:
+    return delimiter.join(_clean_str_list_keep_order(parts))
+
+
 def keyword_joined_template(kw: dict, delimiter: str) -> str:
     delimiter = DEFAULT_DELIMITER if delimiter is None else str(delimiter)
     if isinstance(kw, dict) and isinstance(kw.get("parts"), list):
-        parts = _clean_str_list_keep_order(kw.get("parts"))
-        return delimiter.join(parts)
+        parts = kw["parts"]
+        # 전부 str일 때만 cache: 1 / True / 1.0 은 lru key로 같게 취급됨 (+ unhashable item 방지)
+        if all(type(p) is str for p in parts):
+            return _join_parts_cached(tuple(parts), delimiter)
+        return delimiter.join(_clean_str_list_keep_order(parts))
     return str((kw or {}).get("text", "")).strip()
 
 
@@ -291,7 +489,7 @@ def keyword_parts_from_kw(kw: dict, delimiter: str) -> list[str]:
     if not text:
         return []
     if delimiter and delimiter in text:
-        return [p.strip() for p in text.split(delimiter) if p.strip()]
+        return [p for p in map(str.strip, text.split(delimiter)) if p]
     return [text]
 
 
@@ -320,6 +518,33 @@ def validate_import_package(pkg: dict) -> tuple[bool, str]:
     return True, "OK"
 
 
+def parse_param_lines(text: str) -> dict[str, str]:
+    """여러 줄 "name=value" -> {name: value} (빈 줄/빈 이름 무시, '=' 없으면 빈 값, 중복 이름은 마지막 값)"""
+    out = {}
+    for line in (text or "").splitlines():
+        name, _, val = line.partition("=")
+        name = name.strip()
+        if name:
+            out[name] = val.strip()
+    return out
+
+
+@functools.lru_cache(maxsize=2)
+def _checkbox_image_data(checked: bool) -> str:
+    """12x12 checkbox PhotoImage.put data ("{row} {row} ..."): 흰 바탕 + 검은 테두리 (+ 체크 표시)"""
+    size = 12
+    grid = [["white"] * size for _ in range(size)]
+    for k in range(size):
+        grid[0][k] = grid[size - 1][k] = "black"
+        grid[k][0] = grid[k][size - 1] = "black"
+    if checked:
+        for x, y in ((3, 6), (4, 7), (5, 8), (6, 7), (7, 6), (8, 5)):
+            grid[y][x] = "black"
+            if x + 1 < size:
+                grid[y][x + 1] = "black"
+    return " ".join("{" + " ".join(row) + "}" for row in grid)
+
+
 # ------------------------------------------------------------
 # Dialogs
 # ------------------------------------------------------------
@@ -344,6 +569,10 @@ class KeywordDialog(tk.Toplevel):
 
         self._last_split_offer_text = None
         self._split_offer_inflight = False
+        self._preview_after_id = None
+        self._preview_last_text = None
+        self._split_offer_entry = None  # keystroke 후 debounce된 preview 갱신 시 split 제안 검사할 entry
+        self._part_entries: list[ttk.Entry] = []
 
         frm = ttk.Frame(self, padding=12)
         frm.pack(fill=tk.BOTH, expand=True)
@@ -531,6 +760,7 @@ class KeywordDialog(tk.Toplevel):
         ent.pack(side=tk.LEFT, fill=tk.X, expand=True)
         if initial_text:
             ent.insert(0, str(initial_text))
+        self._part_entries.append(ent)
 
         btn = ttk.Button(row, text="-", width=3, command=lambda r=row: self._remove_part_row(r))
         btn.pack(side=tk.LEFT, padx=(6, 0))
@@ -543,17 +773,19 @@ class KeywordDialog(tk.Toplevel):
         self._update_preview()
 
     def _remove_part_row(self, row_frame):
-        children = [w for w in self.parts_container.winfo_children() if isinstance(w, ttk.Frame)]
-        if len(children) <= 1:
-            try:
-                ent = row_frame.winfo_children()[0]
-                if isinstance(ent, ttk.Entry):
+        ent = next((e for e in self._part_entries if e.master is row_frame), None)
+
+        if len(self._part_entries) <= 1:
+            if ent is not None:
+                try:
                     ent.delete(0, tk.END)
-            except Exception:
-                pass
+                except Exception:
+                    pass
             self._update_preview()
             return
 
+        if ent is not None:
+            self._part_entries.remove(ent)
         try:
             row_frame.destroy()
         except Exception:
@@ -563,24 +795,15 @@ class KeywordDialog(tk.Toplevel):
         self._update_preview()
 
     def _get_parts(self) -> list[str]:
-        parts = []
-        for row in self.parts_container.winfo_children():
-            if not isinstance(row, ttk.Frame):
-                continue
-            kids = row.winfo_children()
-            if not kids:
-                continue
-            ent = kids[0]
-            if isinstance(ent, ttk.Entry):
-                s = ent.get().strip()
-                if s:
-                    parts.append(s)
-        return parts
+        return [s for s in (ent.get().strip() for ent in self._part_entries) if s]
 
     def _clear_all_part_rows(self):
-        for child in list(self.parts_container.winfo_children()):
+        # row frame은 각 entry의 master -> winfo_children 조회 없이 destroy
+        rows = [ent.master for ent in self._part_entries]
+        self._part_entries.clear()
+        for row in rows:
             try:
-                child.destroy()
+                row.destroy()
             except Exception:
                 pass
         self._on_parts_container_configure()
@@ -600,9 +823,15 @@ class KeywordDialog(tk.Toplevel):
             pass
 
     def _set_preview_text(self, text: str):
+        text = text or ""
+        # 표시 중인 내용과 같으면 Text widget 갱신 생략 (Tcl 호출 5회 절약)
+        if text == self._preview_last_text:
+            return
+        self._preview_last_text = text
+
         self.preview_text.configure(state="normal")
         self.preview_text.delete("1.0", "end")
-        self.preview_text.insert("1.0", text or "")
+        self.preview_text.insert("1.0", text)
         self.preview_text.configure(state="disabled")
         try:
             self.preview_text.yview_moveto(0.0)
@@ -610,16 +839,34 @@ class KeywordDialog(tk.Toplevel):
             pass
 
     def _update_preview(self):
+        # keystroke burst coalescing: 마지막 입력 후 PREVIEW_DEBOUNCE_MS 뒤 1회만 재계산
+        self._cancel_pending_preview()
+        self._preview_after_id = self.after(PREVIEW_DEBOUNCE_MS, self._do_update_preview)
+
+    def _cancel_pending_preview(self):
+        if self._preview_after_id is not None:
+            try:
+                self.after_cancel(self._preview_after_id)
+            except Exception:
+                pass
+            self._preview_after_id = None
+
+    def _do_update_preview(self):
+        self._preview_after_id = None
         joined = self.delimiter.join(self._get_parts())
         self._set_preview_text(joined)
 
+        entry_widget = self._split_offer_entry
+        self._split_offer_entry = None
+        if entry_widget is not None:
+            self._offer_split_from_part_entry(entry_widget)
+
     def _split_by_delimiter(self, text: str) -> list[str]:
         delim = self.delimiter if self.delimiter is not None else DEFAULT_DELIMITER
         delim = str(delim)
         if delim == "":
             return []
-        parts = [p.strip() for p in (text or "").split(delim)]
-        return [p for p in parts if p]
+        return [p for p in map(str.strip, (text or "").split(delim)) if p]
 
     def _confirm_apply_split(self, parts: list[str], source_label: str) -> bool:
         if not parts:
@@ -652,8 +899,9 @@ class KeywordDialog(tk.Toplevel):
         self.after(1, lambda: self._offer_split_from_part_entry(entry_widget))
 
     def _on_part_entry_keyrelease(self, _event, entry_widget):
+        # split 제안 검사도 preview와 같은 debounce timer로 합침 (keystroke마다 실행 X)
+        self._split_offer_entry = entry_widget
         self._update_preview()
-        self._offer_split_from_part_entry(entry_widget)
 
     def _offer_split_from_part_entry(self, entry_widget):
         if self._split_offer_inflight:
@@ -708,14 +956,8 @@ class KeywordDialog(tk.Toplevel):
             return None
 
     def _toggle_tag(self, tag: str, start: str, end: str):
-        has_any = False
-        idx = start
-        while self.txt_desc.compare(idx, "<", end):
-            tags = self.txt_desc.tag_names(idx)
-            if tag in tags:
-                has_any = True
-                break
-            idx = self.txt_desc.index(f"{idx}+1c")
+        # [start, end) 안에 tag가 있는지: start를 덮는 range 또는 구간 안에서 시작하는 range (Tcl 호출 2회)
+        has_any = tag in self.txt_desc.tag_names(start) or bool(self.txt_desc.tag_nextrange(tag, start, end))
 
         if has_any:
             self.txt_desc.tag_remove(tag, start, end)
@@ -732,7 +974,8 @@ class KeywordDialog(tk.Toplevel):
         self._toggle_tag("b", start, end)
 
     def _apply_color(self, color_name: str):
-        if color_name not in DESC_COLOR_KEYS:
+        ctag = DESC_COLOR_TAGS.get(color_name)
+        if ctag is None:
             return
 
         rng = self._get_sel_range()
@@ -742,59 +985,74 @@ class KeywordDialog(tk.Toplevel):
             start = self.txt_desc.index("insert linestart")
             end = self.txt_desc.index("insert lineend")
 
-        for t in ("c_black", "c_red", "c_blue"):
+        for t in DESC_COLOR_TAGS.values():
             self.txt_desc.tag_remove(t, start, end)
 
-        self.txt_desc.tag_add(f"c_{color_name}", start, end)
+        self.txt_desc.tag_add(ctag, start, end)
 
-    def _serialize_desc_rich(self):
-        text = self.txt_desc.get("1.0", "end-1c")
+    def _desc_char_offset(self, idx) -> int:
+        res = self.txt_desc.count("1.0", idx, "chars")
+        if isinstance(res, tuple):
+            res = res[0] if res else 0
+        return int(res or 0)
+
+    def _serialize_desc_rich(self, text: str | None = None):
+        if text is None:
+            text = self.txt_desc.get("1.0", "end-1c")
         if not text:
             return []
 
+        # tag별 tag_ranges 1회 -> char offset 경계에서만 상태 전환 (글자별 tag_names 호출 제거)
+        n = len(text)
+        events: dict[int, list[tuple[str, int]]] = {}
+        offsets: dict[str, int] = {}  # 인접 run은 경계 index 공유 -> count() 1회만
+
+        def offset(idx) -> int:
+            key = str(idx)
+            off = offsets.get(key)
+            if off is None:
+                off = offsets[key] = min(self._desc_char_offset(idx), n)
+            return off
+
+        for tag in ("b", "c_red", "c_blue", "c_black"):
+            ranges = self.txt_desc.tag_ranges(tag)
+            for k in range(0, len(ranges) - 1, 2):
+                a = offset(ranges[k])
+                z = offset(ranges[k + 1])
+                if a < z:
+                    events.setdefault(a, []).append((tag, 1))
+                    events.setdefault(z, []).append((tag, -1))
+
+        bounds = sorted(set(events) | {0, n})
+        active = {"b": 0, "c_red": 0, "c_blue": 0, "c_black": 0}
         runs = []
         cur = None
 
-        for i, ch in enumerate(text):
-            idx = f"1.0+{i}c"
-            tags = set(self.txt_desc.tag_names(idx))
+        for a, z in zip(bounds, bounds[1:]):
+            for tag, delta in events.get(a, ()):
+                active[tag] += delta
 
-            b = ("b" in tags)
+            b = active["b"] > 0
             c = "black"
-            if "c_red" in tags:
+            if active["c_red"] > 0:
                 c = "red"
-            elif "c_blue" in tags:
+            elif active["c_blue"] > 0:
                 c = "blue"
-            elif "c_black" in tags:
-                c = "black"
 
+            seg = text[a:z]
             if cur and cur["b"] == b and cur["c"] == c:
-                cur["text"] += ch
+                cur["text"] += seg
             else:
-                cur = {"text": ch, "b": b, "c": c}
+                cur = {"text": seg, "b": b, "c": c}
                 runs.append(cur)
 
         return [r for r in runs if r.get("text")]
 
     def _apply_desc_rich(self, runs: list[dict]):
         self.txt_desc.delete("1.0", "end")
-        for r in runs:
-            if not isinstance(r, dict):
-                continue
-            t = str(r.get("text", ""))
-            if not t:
-                continue
-
-            start = self.txt_desc.index("end-1c")
-            self.txt_desc.insert("end", t)
-            end = self.txt_desc.index("end-1c")
-
-            if r.get("b"):
-                self.txt_desc.tag_add("b", start, end)
-
-            c = r.get("c", "black")
-            if c in DESC_COLOR_KEYS:
-                self.txt_desc.tag_add(f"c_{c}", start, end)
+        args = _desc_rich_insert_args(runs)
+        if args:
+            self.txt_desc.insert("end", *args)
 
     def _ok(self):
         parts = self._get_parts()
@@ -802,8 +1060,9 @@ class KeywordDialog(tk.Toplevel):
             messagebox.showwarning("Warning", "At least one non-empty part is required.")
             return
 
-        desc_plain = self.txt_desc.get("1.0", "end-1c").strip()
-        desc_rich = self._serialize_desc_rich()
+        desc_text = self.txt_desc.get("1.0", "end-1c")
+        desc_plain = desc_text.strip()
+        desc_rich = self._serialize_desc_rich(desc_text)
 
         self.result = {
             "parts": parts,
@@ -812,6 +1071,46 @@ class KeywordDialog(tk.Toplevel):
             "desc": desc_plain,
             "desc_rich": desc_rich,
         }
+        self._cancel_pending_preview()
+        self.destroy()
+
+    def _cancel(self):
+        self.result = None
+        self._cancel_pending_preview()
+        self.destroy()
+
+
+class BulkParamDialog(tk.Toplevel):
+    """여러 param을 "name=value" 줄 단위로 한 번에 입력 (result: 입력 text 또는 None)"""
+    def __init__(self, parent, title="Bulk Add Params"):
+        super().__init__(parent)
+        self.title(title)
+        self.resizable(True, True)
+        self.result = None
+
+        frm = ttk.Frame(self, padding=12)
+        frm.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(frm, text="한 줄에 하나씩 name=value (기존 param은 값이 갱신됨)").grid(row=0, column=0, sticky="w")
+        self.txt = tk.Text(frm, width=48, height=12, wrap="none")
+        self.txt.grid(row=1, column=0, sticky="nsew", pady=(2, 10))
+
+        btns = ttk.Frame(frm)
+        btns.grid(row=2, column=0, sticky="e")
+        ttk.Button(btns, text="Cancel", command=self._cancel).pack(side=tk.LEFT, padx=6)
+        ttk.Button(btns, text="OK", command=self._ok).pack(side=tk.LEFT)
+
+        frm.columnconfigure(0, weight=1)
+        frm.rowconfigure(1, weight=1)
+
+        self.transient(parent)
+        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self._cancel)
+        self.txt.focus_set()
+        self.wait_window(self)
+
+    def _ok(self):
+        self.result = self.txt.get("1.0", "end-1c")
         self.destroy()
 
     def _cancel(self):
@@ -827,6 +1126,8 @@ class InfoPopup(tk.Toplevel):
         super().__init__(parent)
         self.title(title)
         self.geometry("840x520")
+        self._pending_desc = []
+        self._fill_after_id = None
 
         frm = ttk.Frame(self, padding=12)
         frm.pack(fill=tk.BOTH, expand=True)
@@ -862,24 +1163,19 @@ class InfoPopup(tk.Toplevel):
         txt.tag_configure("c_blue", foreground="blue")
 
         if isinstance(desc_rich, list) and desc_rich:
-            for r in desc_rich:
-                if not isinstance(r, dict):
-                    continue
-                t = str(r.get("text", ""))
-                if not t:
-                    continue
-                start = txt.index("end-1c")
-                txt.insert("end", t)
-                end = txt.index("end-1c")
-                if r.get("b"):
-                    txt.tag_add("b", start, end)
-                c = r.get("c", "black")
-                if c in DESC_COLOR_KEYS:
-                    txt.tag_add(f"c_{c}", start, end)
+            args = _desc_rich_insert_args(desc_rich)
         else:
-            txt.insert("1.0", desc or "")
+            args = [desc, ()] if desc else []
 
+        # 첫 chunk만 즉시 insert, 나머지는 _fill_more_desc가 after로 이어서 채움
+        chunks = _chunk_insert_args(args, INFO_DESC_CHUNK_CHARS)
+        if chunks:
+            txt.insert("end", *chunks[0])
         txt.configure(state="disabled")
+        self._txt_desc = txt
+        self._pending_desc = chunks[1:]
+        if self._pending_desc:
+            self._fill_after_id = self.after(INFO_DESC_FILL_MS, self._fill_more_desc)
 
         btns = ttk.Frame(frm)
         btns.grid(row=8, column=0, sticky="e", pady=(10, 0))
@@ -892,6 +1188,37 @@ class InfoPopup(tk.Toplevel):
         self.grab_set()
         self.protocol("WM_DELETE_WINDOW", self.destroy)
 
+    def destroy(self):
+        # fill 도중 닫힘(Close / WM_DELETE_WINDOW / parent 종료): 예약된 after 먼저 취소 -> Tk background error 방지
+        self._cancel_pending_fill()
+        super().destroy()
+
+    def _cancel_pending_fill(self):
+        self._pending_desc = []
+        if self._fill_after_id is not None:
+            try:
+                self.after_cancel(self._fill_after_id)
+            except Exception:
+                pass
+            self._fill_after_id = None
+
+    def _fill_more_desc(self):
+        self._fill_after_id = None
+        if not self._pending_desc:
+            return
+        try:
+            if not self.winfo_exists():
+                return
+            txt = self._txt_desc
+            txt.configure(state="normal")
+            txt.insert("end", *self._pending_desc.pop(0))
+            txt.configure(state="disabled")
+        except Exception:
+            self._pending_desc = []
+            return
+        if self._pending_desc:
+            self._fill_after_id = self.after(INFO_DESC_FILL_MS, self._fill_more_desc)
+
 
 # ------------------------------------------------------------
 # Main App
@@ -901,16 +1228,34 @@ class KeywordGuideApp(tk.Tk):
         super().__init__()
         self.title(f"Chipset Log Keyword Guide  v{APP_VERSION}")
 
-        self.db = load_json(DB_PATH) or self._default_db()
+        # load_json은 항상 dict 반환 -> default tree는 DB가 비어있을 때(first-run / parse error)만 1회 생성
+        db = load_json(DB_PATH)
+        self.db = db if db else self._default_db()
         self.ui_state = load_json(UI_STATE_PATH)
+        # 마지막으로 기록(또는 load)된 UI state -> 종료 시 변경 없으면 직렬화/write 생략
+        self._ui_state_saved = dict(self.ui_state) if isinstance(self.ui_state, dict) else {}
 
-        vendors = list(self.db.keys()) if isinstance(self.db, dict) else []
-        if not vendors:
-            self.db = self._default_db()
-            vendors = list(self.db.keys())
+        # persistence: dirty flags + pending flush (after id) + background writer
+        self._db_dirty = False
+        self._cfg_dirty = False
+        self._flush_after_id = None
+        self._start_writer()
+
+        # DB serialization: vendor -> cached member bytes, dirty vendors (None = all)
+        self._db_fragments = {}
+        self._db_dirty_vendors = set()
+
+        # vendor -> (cfg issues list, set(issues)) membership index
+        self._issue_sets = {}
 
-        raw_cfg = load_json(ISSUES_PATH)
-        self.issue_cfg = ensure_issue_config_vendor_scoped(raw_cfg, vendors)
+        # vendor -> resolved delimiter (invalidated on delimiter set / issue config persist)
+        self._delim_cache = {}
+
+        # (issue_cfg 객체, vendor tuple): 마지막으로 ensure_issue_config_vendor_scoped 정규화한 상태
+        self._cfg_ensured = None
+
+        # raw config 정규화는 _sync_vendor_scoped_config_with_db 안의 _ensure_issue_cfg가 수행
+        self.issue_cfg = load_json(ISSUES_PATH)
         self._sync_vendor_scoped_config_with_db()
 
         # current selection state
@@ -920,13 +1265,45 @@ class KeywordGuideApp(tk.Tk):
         self.status_var = tk.StringVar(value="Ready")
         self.delim_var = tk.StringVar(value=DEFAULT_DELIMITER)
 
-        # param in-place editor state
+        # keyword tree: last rendered signature (same sig -> skip rebuild) + iid -> last values
+        self._last_render_sig = None
+        self._tree_row_cache = {}
+        self._checked_iids = set()
+
+        # param tree: iid(param name) -> 표시 중인 값 (diff 비교 시 Tcl read 생략)
+        self._param_row_cache = {}
+
+        # keyword_joined_template memo: (id(kw), delim) -> (kw, joined)
+        self._join_cache = {}
+
+        # normalized category obj cache: (vendor, issue, detail) -> obj
+        self._obj_cache = {}
+
+        # id(category obj) -> 이미 normalize된 _keywords list (같은 list 객체면 재정규화 생략)
+        self._normalized_kws = {}
+
+        # id(_keywords list) -> (list, delim, 참조 placeholder 이름 set): keyword CRUD 시 무효화
+        self._ref_params_memo = {}
+
+        # 현재 (vendor, issue, detail) key: 세 StringVar write trace로 무효화 -> 매 호출 Tcl get 3회 생략
+        self._cur_path_key = None
+        for var in (self.vendor_var, self.issue_var, self.detail_var):
+            var.trace_add("write", self._on_path_var_write)
+
+        # param list + keyword preview 재계산: after_idle 1회로 합침 (pending id, 복원할 param 선택)
+        self._param_refresh_after_id = None
+        self._param_refresh_select = None
+        self._param_refresh_changed = set()  # 바뀐 param 이름 (None: preview 전체 갱신)
+
+        # param in-place editor state (_param_editor: 편집 중일 때만 set, entry widget은 1개를 place/forget 재사용)
         self._param_editor = None
         self._param_editing = None
+        self._param_editor_entry = None
 
         # copy feedback
         self._copy_feedback_after_id = None
         self._copy_feedback_row = None
+        self._copy_feedback_which = None
 
         # nav open state cache
         self._nav_open_set = set()
@@ -989,10 +1366,40 @@ class KeywordGuideApp(tk.Tk):
         issues = vobj.get("issues", [])
         return list(issues) if isinstance(issues, list) else []
 
-    def _set_vendor_issues(self, vendor: str, issues: list[str]):
+    def _vendor_issues_live(self, vendor: str) -> list[str]:
+        # cfg의 issues list 자체 (copy 없음): 제자리 수정 후 _set_vendor_issues(…, iset)로 set과 함께 등록
+        issues = self._get_vendor_cfg(vendor).get("issues")
+        return issues if isinstance(issues, list) else []
+
+    def _vendor_issue_set(self, vendor: str) -> set:
+        """issue 존재 여부 O(1) 조회용 set. cfg issues list 객체가 교체되면(set/ensure/import) 자동 재구성"""
+        issues = self._get_vendor_cfg(vendor).get("issues", [])
+        hit = self._issue_sets.get(vendor)
+        if hit is not None and hit[0] is issues:
+            return hit[1]
+        iset = set(issues) if isinstance(issues, list) else set()
+        self._issue_sets[vendor] = (issues, iset)
+        return iset
+
+    def _ensure_issue_cfg(self, vendors: list[str] | None = None):
+        """ensure_issue_config_vendor_scoped: 같은 cfg 객체 + 같은 vendor 목록으로 이미 정규화했으면 생략"""
+        vt = tuple(self.db.keys()) if vendors is None else tuple(vendors)
+        done = self._cfg_ensured
+        if done is not None and done[0] is self.issue_cfg and done[1] == vt:
+            return
+        self.issue_cfg = ensure_issue_config_vendor_scoped(self.issue_cfg, list(vt))
+        self._cfg_ensured = (self.issue_cfg, vt)
+
+    def _set_vendor_issues(self, vendor: str, issues: list[str], iset: set | None = None):
+        # iset: 호출 측에서 이미 갱신한 membership set -> 다음 조회 시 재구성 생략
+        self._cfg_ensured = None
         self.issue_cfg.setdefault("vendors", {})
         self.issue_cfg["vendors"].setdefault(vendor, {})
         self.issue_cfg["vendors"][vendor]["issues"] = issues
+        if iset is None:
+            self._issue_sets.pop(vendor, None)
+        else:
+            self._issue_sets[vendor] = (issues, iset)
 
     def _get_vendor_delimiter(self, vendor: str) -> str:
         vobj = self._get_vendor_cfg(vendor)
@@ -1001,47 +1408,194 @@ class KeywordGuideApp(tk.Tk):
             return DEFAULT_DELIMITER
         return str(delim)
 
+    def _delim_cached(self, vendor: str) -> str:
+        delim = self._delim_cache.get(vendor)
+        if delim is None:
+            delim = self._get_vendor_delimiter(vendor)
+            self._delim_cache[vendor] = delim
+        return delim
+
     def _set_vendor_delimiter(self, vendor: str, delim: str):
+        self._cfg_ensured = None
+        self._delim_cache.pop(vendor, None)
         self.issue_cfg.setdefault("vendors", {})
         self.issue_cfg["vendors"].setdefault(vendor, {})
         self.issue_cfg["vendors"][vendor]["delimiter"] = "" if delim is None else str(delim)
 
+    # --------------------------------------------------------
+    # Persistence (dirty flag + coalesced flush)
+    # --------------------------------------------------------
     def _persist_issues(self, msg: str):
-        try:
-            self.issue_cfg = ensure_issue_config_vendor_scoped(self.issue_cfg, list(self.db.keys()))
-            ok, smsg = save_json(ISSUES_PATH, self.issue_cfg)
-            self.log(msg + ("" if ok else f" (WARN: {smsg})"))
-        except Exception as e:
-            self.log(f"Issue config save failed: {e}")
+        # vendor set 변경(add/delete/rename vendor)은 호출 측에서 _ensure_issue_cfg 수행
+        self._cfg_dirty = True
+        self._cfg_ensured = None
+        self._last_render_sig = None
+        self._join_cache.clear()
+        self._delim_cache.clear()
+        self.log(msg)
+        self._schedule_flush()
+
+    def _mark_db_dirty(self, vendor: str | None = None):
+        # vendor 지정: 해당 vendor만 변경됨 (flush 시 그 vendor만 재직렬화), None: 전체
+        if vendor is None:
+            self._db_dirty_vendors = None
+        elif self._db_dirty_vendors is not None:
+            self._db_dirty_vendors.add(vendor)
+        self._db_dirty = True
+
+    def _persist_db(self, msg: str, vendor: str | None = None):
+        # 모든 data mutation은 여기를 거침 -> keyword tree render sig도 함께 무효화
+        self._mark_db_dirty(vendor)
+        # join cache는 비우지 않음: entry가 (kw identity, delim) 검증이라 바뀐 kw만 자동 miss
+        self._last_render_sig = None
+        self.log(msg)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """연속 편집은 첫 mutation 후 PERSIST_FLUSH_DELAY_MS 뒤 1회 write로 합침 (pending 중 재예약 없음 -> 최대 지연 고정)"""
+        if self._flush_after_id is None:
+            self._flush_after_id = self.after(PERSIST_FLUSH_DELAY_MS, self._flush_pending_saves)
+
+    def _flush_pending_saves(self):
+        if self._flush_after_id is not None:
+            try:
+                self.after_cancel(self._flush_after_id)
+            except Exception:
+                pass
+            self._flush_after_id = None
+
+        # 직렬화(snapshot)는 UI thread에서, 파일 write는 writer thread에서
+        if self._db_dirty:
+            self._db_dirty = False
+            try:
+                self._enqueue_write(DB_PATH, self._serialize_db(), "DB")
+            except Exception as e:
+                self.log(f"Save failed: {e}")
+
+        if self._cfg_dirty:
+            self._cfg_dirty = False
+            try:
+                self._enqueue_write(ISSUES_PATH, _json_dumps_bytes(self.issue_cfg), "Issue config")
+            except Exception as e:
+                self.log(f"Issue config save failed: {e}")
 
-    def _persist_db(self, msg: str):
+    # --------------------------------------------------------
+    # Background writer (file I/O off the Tk thread)
+    # --------------------------------------------------------
+    def _start_writer(self):
+        self._write_q = queue.Queue()
+        self._write_results = queue.Queue()
+        # enqueue 됐지만 writer가 아직 처리를 끝내지 않은 write 수 (poller 종료 판단용)
+        self._write_pending = 0
+        self._write_lock = threading.Lock()
+        self._write_poll_after_id = None
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="keyword-guide-writer", daemon=True)
+        self._writer_thread.start()
+
+    def _writer_loop(self):
+        # Tk 호출 금지 (결과는 _write_results -> UI thread polling으로 전달)
+        stop = False
+        while not stop:
+            item = self._write_q.get()
+            if item is None:
+                return
+
+            # 밀린 요청은 path별 최신 snapshot만 기록
+            batch = {item[0]: item}
+            taken = 1
+            while True:
+                try:
+                    nxt = self._write_q.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                batch[nxt[0]] = nxt
+                taken += 1
+
+            for path, payload, label in batch.values():
+                try:
+                    ok, smsg = save_json_bytes(path, payload)
+                except Exception as e:
+                    ok, smsg = False, str(e)
+                if not ok:
+                    self._write_results.put(f"{label} save (WARN: {smsg})")
+            # 결과를 put 한 뒤 감소 -> pending 0이면 결과는 이미 _write_results에 있음
+            with self._write_lock:
+                self._write_pending -= taken
+
+    def _enqueue_write(self, path: Path, payload: bytes, label: str):
+        with self._write_lock:
+            self._write_pending += 1
+        self._write_q.put((path, payload, label))
+        if self._write_poll_after_id is None:
+            self._write_poll_after_id = self.after(WRITER_POLL_MS, self._poll_write_results)
+
+    def _poll_write_results(self):
+        self._write_poll_after_id = None
+        while True:
+            try:
+                msg = self._write_results.get_nowait()
+            except queue.Empty:
+                break
+            self.log(msg)
+        with self._write_lock:
+            pending = self._write_pending
+        if pending > 0 or not self._write_results.empty():
+            self._write_poll_after_id = self.after(WRITER_POLL_MS, self._poll_write_results)
+
+    def _stop_writer(self):
+        """pending write를 모두 끝낸 뒤 writer 종료 (on_close 전용)"""
+        self._write_q.put(None)
+        self._writer_thread.join()
+
+    def _serialize_db(self) -> bytes:
+        """dirty vendor만 재직렬화 + 나머지는 cached fragment 재사용 (결과는 전체 dump와 byte 동일)"""
+        dirty = self._db_dirty_vendors
+        self._db_dirty_vendors = set()
+        old = self._db_fragments
         try:
-            ok, smsg = save_json(DB_PATH, self.db)
-            self.log(msg + ("" if ok else f" (WARN: {smsg})"))
-        except Exception as e:
-            self.log(f"Save failed: {e}")
+            frags = {}
+            for v, vobj in self.db.items():
+                frag = None if (dirty is None or v in dirty) else old.get(v)
+                if frag is None:
+                    frag = _json_member_bytes(v, vobj)
+                frags[v] = frag
+        except Exception:
+            self._db_fragments = {}
+            raise
+        self._db_fragments = frags
+        return _json_object_from_members(frags.values())
 
     def _persist_ui_state(self, msg: str, state: dict):
+        # DB/issue config와 같은 writer queue 경유 (path별 최신 snapshot만 기록, 동일 내용이면 write skip)
+        # 마지막 저장본과 같은 state(크기/경로 변경 없음)면 직렬화부터 생략
+        if state == self._ui_state_saved:
+            return
         try:
-            ok, smsg = save_json(UI_STATE_PATH, state)
-            self.log(msg + ("" if ok else f" (WARN: {smsg})"))
+            self._enqueue_write(UI_STATE_PATH, _json_dumps_bytes(state), "UI state")
+            self._ui_state_saved = dict(state)
+            self.log(msg)
         except Exception as e:
             self.log(f"UI state save failed: {e}")
 
     def _sync_vendor_scoped_config_with_db(self):
+        changed_all = False
         if not isinstance(self.db, dict):
             self.db = self._default_db()
+            changed_all = True
 
         vendors = list(self.db.keys())
-        self.issue_cfg = ensure_issue_config_vendor_scoped(self.issue_cfg, vendors)
+        self._ensure_issue_cfg(vendors)
 
         changed_cfg = False
-        changed_db = False
+        changed_vendors = set()  # 실제로 보정된 vendor만 dirty 처리 (전체 재직렬화 X)
 
         for v in vendors:
-            self.db.setdefault(v, {})
             if not isinstance(self.db[v], dict):
                 self.db[v] = {}
+                changed_vendors.add(v)
 
             cfg_list = self._get_vendor_issues(v)
             if not cfg_list:
@@ -1049,24 +1603,19 @@ class KeywordGuideApp(tk.Tk):
                 self._set_vendor_issues(v, cfg_list)
                 changed_cfg = True
 
-            existing_db_issues = [str(x) for x in self.db[v].keys()]
+            # db issue key -> cfg에 없는 것만 append (live dict key를 C-level map으로 정리, 중간 list 없음)
+            vobj = self.db[v]
             seen = set(cfg_list)
-            appended = False
-            for it in existing_db_issues:
-                s = str(it).strip()
-                if not s or s in seen:
-                    continue
-                cfg_list.append(s)
-                seen.add(s)
-                appended = True
-            if appended:
+            new_issues = [s for s in dict.fromkeys(map(str.strip, map(str, vobj))) if s and s not in seen]
+            if new_issues:
+                cfg_list.extend(new_issues)
                 self._set_vendor_issues(v, cfg_list)
                 changed_cfg = True
 
             for issue_name in cfg_list:
-                if issue_name not in self.db[v]:
-                    self.db[v][issue_name] = self._default_issue_obj()
-                    changed_db = True
+                if issue_name not in vobj:
+                    vobj[issue_name] = self._default_issue_obj()
+                    changed_vendors.add(v)
 
             delim = self._get_vendor_delimiter(v)
             if delim is None:
@@ -1074,15 +1623,13 @@ class KeywordGuideApp(tk.Tk):
                 changed_cfg = True
 
         if changed_cfg:
-            try:
-                save_json(ISSUES_PATH, self.issue_cfg)
-            except Exception:
-                pass
-        if changed_db:
-            try:
-                save_json(DB_PATH, self.db)
-            except Exception:
-                pass
+            self._cfg_dirty = True
+        if changed_all:
+            self._mark_db_dirty(None)
+        for v in changed_vendors:
+            self._mark_db_dirty(v)
+        if changed_cfg or changed_all or changed_vendors:
+            self._schedule_flush()
 
     # --------------------------------------------------------
     # UI Build
@@ -1236,6 +1783,13 @@ class KeywordGuideApp(tk.Tk):
         self.inline_box = ttk.LabelFrame(right, text="Inline Parameters (selected keyword placeholders)")
         self.inline_box.grid(row=3, column=0, sticky="ew", pady=(6, 0))
 
+        # inline widgets: 1회 생성 후 pack/pack_forget으로 재사용
+        self._inline_hint = ttk.Label(self.inline_box, text="Select a keyword containing placeholders like {CH}, {ABC}.")
+        self._inline_header = ttk.Label(self.inline_box, text="Detected placeholders (Apply updates category-level params):")
+        self._inline_row_pool = []  # [(frame, label, entry, button), ...]
+        self._inline_visible = []
+        self._inline_shown = None  # 현재 표시 중인 placeholder tuple (None: hint/빈 상태)
+
         param_box = ttk.LabelFrame(right, text="Parameters (Category-level)")
         param_box.grid(row=4, column=0, sticky="nsew", pady=(10, 0))
 
@@ -1253,6 +1807,7 @@ class KeywordGuideApp(tk.Tk):
         pbtns = ttk.Frame(param_box)
         pbtns.grid(row=1, column=0, sticky="e", padx=8, pady=(0, 8))
         ttk.Button(pbtns, text="Add", command=self.add_param).pack(side=tk.LEFT, padx=4)
+        ttk.Button(pbtns, text="Bulk Add", command=self.add_params_bulk).pack(side=tk.LEFT, padx=4)
         ttk.Button(pbtns, text="Remove", command=self.remove_param).pack(side=tk.LEFT, padx=4)
 
         self.param_tree.bind("<Double-1>", self.on_param_cell_double_click)
@@ -1358,6 +1913,64 @@ class KeywordGuideApp(tk.Tk):
         except Exception:
             pass
 
+    def _nav_detail_order(self, v: str, i: str) -> list[str]:
+        # nav tree 표시 순서: _COMMON 먼저, 나머지는 dict 순서
+        details = list(self.db[v][i].keys())
+        if "_COMMON" in details:
+            details = ["_COMMON"] + [x for x in details if x != "_COMMON"]
+        return details
+
+    def _select_nav_path(self, restore_path) -> bool:
+        # detail -> issue -> vendor 순으로 존재하는 node 선택 (성공 시 True)
+        v, i, d = restore_path
+        target = None
+        if v and i and d:
+            t = self._nav_iid_detail(v, i, d)
+            if self.nav_tree.exists(t):
+                target = t
+        if not target and v and i:
+            t = self._nav_iid_issue(v, i)
+            if self.nav_tree.exists(t):
+                target = t
+        if not target and v:
+            t = self._nav_iid_vendor(v)
+            if self.nav_tree.exists(t):
+                target = t
+
+        if target:
+            try:
+                self._open_ancestors(target)
+                self.nav_tree.selection_set(target)
+                self.nav_tree.see(target)
+                self._apply_nav_selection(target)
+                return True
+            except Exception:
+                pass
+        return False
+
+    def refresh_nav_details(self, v: str, i: str, select: str):
+        """category CRUD 후 해당 issue node의 detail child만 diff 갱신 (nav tree 전체 rebuild X)"""
+        iid = self._nav_iid_issue(v, i)
+        if not self.nav_tree.exists(iid):
+            self.build_nav_tree(select_default=True, restore_path=(v, i, select))
+            return
+
+        details = self._nav_detail_order(v, i)
+        wanted = [self._nav_iid_detail(v, i, d) for d in details]
+        existing = self.nav_tree.get_children(iid)
+        wanted_set = set(wanted)
+        stale = [c for c in existing if c not in wanted_set]
+        if stale:
+            self.nav_tree.delete(*stale)
+        existing_set = set(existing)
+        for idx, (d, did) in enumerate(zip(details, wanted)):
+            if did not in existing_set:
+                self.nav_tree.insert(iid, idx, iid=did, text=d, open=False)
+        if tuple(wanted) != self.nav_tree.get_children(iid):
+            self.nav_tree.set_children(iid, *wanted)
+
+        self._select_nav_path((v, i, select))
+
     def build_nav_tree(self, select_default=True, restore_path=None):
         try:
             self._store_nav_open_state()
@@ -1370,7 +1983,7 @@ class KeywordGuideApp(tk.Tk):
             self.db = self._default_db()
             vendors = list(self.db.keys())
 
-        self.issue_cfg = ensure_issue_config_vendor_scoped(self.issue_cfg, vendors)
+        self._ensure_issue_cfg(vendors)
 
         for v in vendors:
             vid = self._nav_iid_vendor(v)
@@ -1385,41 +1998,14 @@ class KeywordGuideApp(tk.Tk):
 
                 self.db.setdefault(v, {})
                 self.db[v].setdefault(issue, self._default_issue_obj())
-                details = list(self.db[v][issue].keys())
-                if "_COMMON" in details:
-                    details = ["_COMMON"] + [x for x in details if x != "_COMMON"]
-
-                for d in details:
+                for d in self._nav_detail_order(v, issue):
                     did = self._nav_iid_detail(v, issue, d)
                     self.nav_tree.insert(iid, "end", iid=did, text=d, open=False)
 
         self._restore_nav_open_state()
 
-        if restore_path:
-            v, i, d = restore_path
-            target = None
-            if v and i and d:
-                t = self._nav_iid_detail(v, i, d)
-                if self.nav_tree.exists(t):
-                    target = t
-            if not target and v and i:
-                t = self._nav_iid_issue(v, i)
-                if self.nav_tree.exists(t):
-                    target = t
-            if not target and v:
-                t = self._nav_iid_vendor(v)
-                if self.nav_tree.exists(t):
-                    target = t
-
-            if target:
-                try:
-                    self._open_ancestors(target)
-                    self.nav_tree.selection_set(target)
-                    self.nav_tree.see(target)
-                    self._apply_nav_selection(target)
-                    return
-                except Exception:
-                    pass
+        if restore_path and self._select_nav_path(restore_path):
+            return
 
         if select_default:
             if vendors:
@@ -1429,7 +2015,7 @@ class KeywordGuideApp(tk.Tk):
                     issues = list(self.db.get(v, {}).keys())
                 if issues:
                     i = issues[0]
-                    d = "_COMMON" if "_COMMON" in self.db[v][i] else (list(self.db[v][i].keys())[0] if self.db[v][i] else "_COMMON")
+                    d = "_COMMON" if "_COMMON" in self.db[v][i] else next(iter(self.db[v][i]), "_COMMON")
                     target = self._nav_iid_detail(v, i, d)
                     if not self.nav_tree.exists(target):
                         target = self._nav_iid_issue(v, i)
@@ -1468,7 +2054,7 @@ class KeywordGuideApp(tk.Tk):
 
         if kind == "v":
             self.vendor_var.set(v)
-            self.delim_var.set(self._get_vendor_delimiter(v))
+            self.delim_var.set(self._delim_cached(v))
 
             issues = self._get_vendor_issues(v)
             if not issues:
@@ -1490,7 +2076,7 @@ class KeywordGuideApp(tk.Tk):
         elif kind == "i":
             self.vendor_var.set(v)
             self.issue_var.set(i)
-            self.delim_var.set(self._get_vendor_delimiter(v))
+            self.delim_var.set(self._delim_cached(v))
 
             details = list(self.db.get(v, {}).get(i, {}).keys())
             if "_COMMON" in details:
@@ -1502,7 +2088,7 @@ class KeywordGuideApp(tk.Tk):
             self.vendor_var.set(v)
             self.issue_var.set(i)
             self.detail_var.set(d)
-            self.delim_var.set(self._get_vendor_delimiter(v))
+            self.delim_var.set(self._delim_cached(v))
 
         self._ensure_path_exists(v, self.issue_var.get(), self.detail_var.get())
         self.refresh_all()
@@ -1510,10 +2096,18 @@ class KeywordGuideApp(tk.Tk):
     def _ensure_path_exists(self, v, i, d):
         if not v or not i or not d:
             return
+        created = v not in self.db
         self.db.setdefault(v, {})
-        self.db[v].setdefault(i, self._default_issue_obj())
-        self.db[v][i].setdefault(d, {"_keywords": [], "_params": {}})
-        self._sync_vendor_scoped_config_with_db()
+        if i not in self.db[v]:
+            self.db[v][i] = self._default_issue_obj()
+            created = True
+        if d not in self.db[v][i]:
+            self.db[v][i][d] = {"_keywords": [], "_params": {}}
+            created = True
+
+        # nav 클릭마다 전체 vendor config 재정규화하지 않음: 경로가 새로 생긴 경우에만 sync
+        if created:
+            self._sync_vendor_scoped_config_with_db()
 
     # --------------------------------------------------------
     # Checkbox Images + Sync
@@ -1521,34 +2115,30 @@ class KeywordGuideApp(tk.Tk):
     def _make_checkbox_images(self):
         def make_img(checked: bool):
             img = tk.PhotoImage(width=12, height=12)
-            img.put("white", to=(0, 0, 12, 12))
-            for x in range(12):
-                img.put("black", (x, 0))
-                img.put("black", (x, 11))
-            for y in range(12):
-                img.put("black", (0, y))
-                img.put("black", (11, y))
-            if checked:
-                pts = [(3, 6), (4, 7), (5, 8), (6, 7), (7, 6), (8, 5)]
-                for (x, y) in pts:
-                    img.put("black", (x, y))
-                    if x + 1 < 12:
-                        img.put("black", (x + 1, y))
+            img.put(_checkbox_image_data(checked))  # pixel 전체를 put 1회로
             return img
 
         self._img_cb_off = make_img(False)
         self._img_cb_on = make_img(True)
 
     def _set_checkbox_for_iid(self, iid: str, checked: bool):
-        try:
-            self.tree.item(iid, image=(self._img_cb_on if checked else self._img_cb_off))
-        except Exception:
-            pass
+        self.tree.item(iid, image=(self._img_cb_on if checked else self._img_cb_off))
 
     def _sync_checkboxes_with_selection(self):
+        # 표시 상태가 바뀐 row만 image 갱신 (전체 row 순회 X)
         sel = set(self.tree.selection())
-        for iid in self.tree.get_children(""):
-            self._set_checkbox_for_iid(iid, iid in sel)
+        changed = sel.symmetric_difference(self._checked_iids)
+        try:
+            for iid in changed:
+                self._set_checkbox_for_iid(iid, iid in sel)
+        except Exception:
+            # 이미 삭제된 iid 등 -> row별 guard로 나머지 row까지 다시 맞춤
+            for iid in changed:
+                try:
+                    self._set_checkbox_for_iid(iid, iid in sel)
+                except Exception:
+                    pass
+        self._checked_iids = sel
 
     def _toggle_checkbox_row(self, iid: str):
         sel = set(self.tree.selection())
@@ -1610,28 +2200,78 @@ class KeywordGuideApp(tk.Tk):
     # --------------------------------------------------------
     # Current object
     # --------------------------------------------------------
+    def _on_path_var_write(self, *_):
+        self._cur_path_key = None
+
     def _current_obj(self):
-        v, i, d = self.vendor_var.get(), self.issue_var.get(), self.detail_var.get()
+        key = self._cur_path_key
+        if key is None:
+            key = (self.vendor_var.get(), self.issue_var.get(), self.detail_var.get())
+            self._cur_path_key = key
+        v, i, d = key
         if not v or not i or not d:
             return {"_keywords": [], "_params": {}}
 
-        self.db.setdefault(v, {})
-        self.db[v].setdefault(i, self._default_issue_obj())
-        self.db[v][i].setdefault(d, {"_keywords": [], "_params": {}})
-
-        obj = self.db[v][i][d]
+        # cache hit: 같은 dict가 아직 db의 해당 경로에 붙어있을 때만 재사용 (rename/delete/import 시 자동 miss)
+        cached = self._obj_cache.get(key)
+        if cached is not None:
+            vobj = self.db.get(v)
+            iobj = vobj.get(i) if isinstance(vobj, dict) else None
+            if isinstance(iobj, dict) and iobj.get(d) is cached:
+                return cached
+
+        # 없는 경로만 생성 (setdefault처럼 hit 시에도 default obj를 만들지 않음)
+        vobj = self.db.get(v)
+        if vobj is None:
+            vobj = self.db[v] = {}
+        iobj = vobj.get(i)
+        if iobj is None:
+            iobj = vobj[i] = self._default_issue_obj()
+        obj = iobj.get(d)
+        if obj is None:
+            obj = iobj[d] = {"_keywords": [], "_params": {}}
 
         if isinstance(obj, list):
             obj = {"_keywords": normalize_keywords(obj), "_params": {}}
-            self.db[v][i][d] = obj
+            iobj[d] = obj
 
         obj.setdefault("_keywords", [])
         obj.setdefault("_params", {})
-        obj["_keywords"] = normalize_keywords(obj["_keywords"])
+        # 한 번 normalize된 list는 다른 경로 갔다 돌아와도 재정규화하지 않음 (add/edit는 항목 단위로 normalize)
+        if self._normalized_kws.get(id(obj)) is not obj["_keywords"]:
+            obj["_keywords"] = normalize_keywords(obj["_keywords"])
+            self._normalized_kws[id(obj)] = obj["_keywords"]
         if not isinstance(obj["_params"], dict):
             obj["_params"] = {}
+        self._obj_cache[key] = obj
         return obj
 
+    def _kw_joined(self, kw: dict, delim: str) -> str:
+        # kw 참조를 함께 보관 -> id 재사용으로 인한 오인 hit 방지
+        key = (id(kw), delim)
+        hit = self._join_cache.get(key)
+        if hit is not None and hit[0] is kw:
+            return hit[1]
+        joined = keyword_joined_template(kw, delim)
+        if len(self._join_cache) >= JOIN_CACHE_MAX:
+            self._join_cache.clear()
+        self._join_cache[key] = (kw, joined)
+        return joined
+
+    def _invalidate_current_obj_cache(self):
+        self._invalidate_obj_cache(self.vendor_var.get(), self.issue_var.get(), self.detail_var.get())
+
+    def _invalidate_obj_cache(self, v: str, i: str | None = None, d: str | None = None):
+        # v / (v, i) / (v, i, d) prefix에 해당하는 cache entry 제거 (delete/rename 시 stale obj 참조 해제)
+        prefix = tuple(x for x in (v, i, d) if x is not None)
+        n = len(prefix)
+        for key in [k for k in self._obj_cache if k[:n] == prefix]:
+            obj = self._obj_cache.pop(key)
+            self._normalized_kws.pop(id(obj), None)
+            kws = obj.get("_keywords")
+            if kws is not None:
+                self._ref_params_memo.pop(id(kws), None)
+
     def _ensure_current_obj_migrated(self):
         _ = self._current_obj()
         self._persist_db("DB migrated/normalized")
@@ -1640,6 +2280,8 @@ class KeywordGuideApp(tk.Tk):
     # Refresh
     # --------------------------------------------------------
     def refresh_all(self, *_):
+        # 이전 category 기준으로 예약된 param refresh(선택/changed set)가 새 category에 적용되지 않도록 취소
+        self._cancel_pending_param_refresh()
         self.refresh_keywords()
         self.refresh_params()
         self.clear_inline()
@@ -1647,69 +2289,193 @@ class KeywordGuideApp(tk.Tk):
         v, i, d = self.vendor_var.get(), self.issue_var.get(), self.detail_var.get()
         self.status_var.set(f"Selected: {v} > {i} > {d}")
 
+    def refresh_params_debounced(self, select: str | None = None, changed: str | None = None):
+        """param/preview 갱신을 idle 시점 1회로 합침 (changed: 값이 바뀐 param 이름, None이면 preview 전체 갱신)"""
+        if select:
+            self._param_refresh_select = select
+        if changed is None:
+            self._param_refresh_changed = None
+        elif self._param_refresh_changed is not None:
+            self._param_refresh_changed.add(changed)
+        if self._param_refresh_after_id is None:
+            self._param_refresh_after_id = self.after_idle(self._do_refresh_params)
+
+    def _cancel_pending_param_refresh(self):
+        if self._param_refresh_after_id is not None:
+            try:
+                self.after_cancel(self._param_refresh_after_id)
+            except Exception:
+                pass
+            self._param_refresh_after_id = None
+        self._param_refresh_select = None
+        self._param_refresh_changed = set()
+
+    def _referenced_params(self) -> set:
+        # 현재 category keyword들이 참조하는 {name} 이름 (category/delimiter별 1회 계산)
+        # PLACEHOLDER_RE 밖의 이름(str.replace fallback으로 치환되는 param)도 포함되도록 BRACE_TOKEN_RE 사용
+        delim = self._delim_cached(self.vendor_var.get())
+        kws = self._current_obj()["_keywords"]
+        hit = self._ref_params_memo.get(id(kws))
+        if hit is not None and hit[0] is kws and hit[1] == delim:
+            return hit[2]
+        joined = self._kw_joined
+        names = set()
+        for kw in kws:
+            text = joined(kw, delim)
+            if "{" in text:
+                names.update(BRACE_TOKEN_RE.findall(text))
+        self._ref_params_memo[id(kws)] = (kws, delim, names)
+        return names
+
+    def _do_refresh_params(self):
+        select = self._param_refresh_select
+        changed = self._param_refresh_changed
+        self._param_refresh_after_id = None
+        self._param_refresh_select = None
+        self._param_refresh_changed = set()
+        self.refresh_params()
+        self._safe_param_restore_selection(select)
+        # 바뀐 param을 참조하는 keyword가 없으면 preview 불변 -> row별 render 생략
+        if changed is not None and not (changed & self._referenced_params()):
+            return
+        self.refresh_keyword_previews_only()
+
     def refresh_keywords(self):
         self._clear_copy_feedback(force=True)
-        self.tree.delete(*self.tree.get_children())
 
         obj = self._current_obj()
         params = obj["_params"]
         v = self.vendor_var.get()
-        delim = self._get_vendor_delimiter(v)
-
-        for idx, kw in enumerate(obj["_keywords"]):
-            raw_joined = keyword_joined_template(kw, delim)
-            summary = kw.get("summary", "")
-            group = kw.get("group", "")
-            preview = render_keyword(raw_joined, params)
+        delim = self._delim_cached(v)
 
+        # refresh 결과는 항상 "선택 없음" (기존 full rebuild와 동일)
+        sel = self.tree.selection()
+        if sel:
+            self.tree.selection_remove(sel)
+            self._sync_checkboxes_with_selection()
+
+        kws = obj["_keywords"]
+        sig = (v, self.issue_var.get(), self.detail_var.get(), delim, id(params), id(kws), len(kws))
+        if sig == self._last_render_sig:
+            return
+        self._last_render_sig = sig
+
+        # row values 먼저 계산 (tuple 1회 생성/row, loop 밖으로 hoist한 lookup 사용)
+        pkey = params_cache_key(params)
+        joined = self._kw_joined
+        rows = [
+            (kw.get("summary", ""), kw.get("group", ""), "Info", "Copy", "CopyNP", render_keyword_cached(joined(kw, delim), pkey))
+            for kw in kws
+        ]
+
+        # diff patch: iid = row index -> 남는 row는 값이 바뀐 경우만 item(), 늘어난 row만 insert, 줄어든 row만 delete
+        cache = self._tree_row_cache
+        n_old = len(self.tree.get_children(""))
+        n_new = len(rows)
+        if n_old > n_new:
+            stale = [str(idx) for idx in range(n_new, n_old)]
+            self.tree.delete(*stale)
+            for iid in stale:
+                cache.pop(iid, None)
+                self._checked_iids.discard(iid)
+
+        item = self.tree.item
+        insert = self.tree.insert
+        img_off = self._img_cb_off
+        for idx, values in enumerate(rows):
             iid = str(idx)
-            self.tree.insert("", "end", iid=iid, text="", values=(summary, group, "Info", "Copy", "CopyNP", preview))
-            self._set_checkbox_for_iid(iid, checked=False)
-
-        self._sync_checkboxes_with_selection()
+            if idx < n_old:
+                if cache.get(iid) != values:
+                    item(iid, values=values)
+            else:
+                insert("", "end", iid=iid, text="", image=img_off, values=values)
+            cache[iid] = values
 
     def refresh_keyword_previews_only(self):
         obj = self._current_obj()
         params = obj["_params"]
         v = self.vendor_var.get()
-        delim = self._get_vendor_delimiter(v)
-
+        delim = self._delim_cached(v)
+        pkey = params_cache_key(params)
+        kws = obj["_keywords"]
+        cache = self._tree_row_cache
+
+        # get_children 결과 iid는 존재 보장 -> row별 try/except 없음
+        n = len(kws)
+        tree_set = self.tree.set
+        joined = self._kw_joined
         for iid in self.tree.get_children(""):
-            try:
-                idx = int(iid)
-            except Exception:
+            if not iid.isdigit():
                 continue
-            if idx < 0 or idx >= len(obj["_keywords"]):
+            idx = int(iid)
+            if idx >= n:
                 continue
 
-            kw = obj["_keywords"][idx]
-            raw_joined = keyword_joined_template(kw, delim)
-            preview = render_keyword(raw_joined, params)
-            try:
-                self.tree.set(iid, "preview", preview)
-            except Exception:
-                pass
+            preview = render_keyword_cached(joined(kws[idx], delim), pkey)
+            # preview 셀이 이미 같은 값이면 tree.set 생략 (바뀐 row만 Tcl 호출)
+            cached = cache.get(iid)
+            if cached is not None and cached[-1] == preview:
+                continue
+            tree_set(iid, "preview", preview)
+            if cached is not None:
+                cache[iid] = cached[:-1] + (preview,)
 
     def refresh_params(self):
-        self.param_tree.delete(*self.param_tree.get_children())
+        # diff update: 사라진 row 삭제 / 새 row만 정렬 위치에 insert / 값 바뀐 cell만 set
         params = self._current_obj()["_params"]
-        for k in sorted(params.keys()):
-            self.param_tree.insert("", "end", iid=k, values=(k, str(params.get(k, ""))))
+        pt = self.param_tree
+
+        cache = self._param_row_cache
+        existing = pt.get_children("")
+        wanted = sorted(params.keys())
+        wanted_set = set(wanted)
+        stale = [k for k in existing if k not in wanted_set]
+        if stale:
+            pt.delete(*stale)
+            for k in stale:
+                cache.pop(k, None)
+
+        existing_set = set(existing)
+        for idx, k in enumerate(wanted):
+            val = str(params.get(k, ""))
+            if k in existing_set:
+                if cache.get(k) != val:
+                    pt.set(k, "pval", val)
+            else:
+                pt.insert("", idx, iid=k, values=(k, val))
+            cache[k] = val
 
     # --------------------------------------------------------
     # Inline params
     # --------------------------------------------------------
+    def _hide_inline_widgets(self):
+        for w in self._inline_visible:
+            w.pack_forget()
+        self._inline_visible = []
+        self._inline_shown = None
+
+    def _inline_row(self, n: int):
+        if n < len(self._inline_row_pool):
+            return self._inline_row_pool[n]
+        row = ttk.Frame(self.inline_box)
+        lbl = ttk.Label(row, width=14)
+        lbl.pack(side=tk.LEFT)
+        ent = ttk.Entry(row, width=28)
+        ent.pack(side=tk.LEFT, padx=(6, 6))
+        btn = ttk.Button(row, text="Apply")
+        btn.pack(side=tk.LEFT)
+        pooled = (row, lbl, ent, btn)
+        self._inline_row_pool.append(pooled)
+        return pooled
+
     def clear_inline(self):
-        for w in self.inline_box.winfo_children():
-            w.destroy()
-        ttk.Label(self.inline_box, text="Select a keyword containing placeholders like {CH}, {ABC}.").pack(anchor="w", padx=8, pady=8)
+        self._hide_inline_widgets()
+        self._inline_hint.pack(anchor="w", padx=8, pady=8)
+        self._inline_visible.append(self._inline_hint)
 
     def on_keyword_select(self, *_):
         self._sync_checkboxes_with_selection()
 
-        for w in self.inline_box.winfo_children():
-            w.destroy()
-
         sel = self.tree.selection()
         if not sel:
             self.clear_inline()
@@ -1728,8 +2494,8 @@ class KeywordGuideApp(tk.Tk):
 
         kw = obj["_keywords"][idx]
         v = self.vendor_var.get()
-        delim = self._get_vendor_delimiter(v)
-        raw_joined = keyword_joined_template(kw, delim)
+        delim = self._delim_cached(v)
+        raw_joined = self._kw_joined(kw, delim)
 
         placeholders = detect_placeholders(raw_joined)
         if not placeholders:
@@ -1739,29 +2505,39 @@ class KeywordGuideApp(tk.Tk):
         for p in placeholders:
             obj["_params"].setdefault(p, "")
 
-        header = ttk.Label(self.inline_box, text="Detected placeholders (Apply updates category-level params):")
-        header.pack(anchor="w", padx=8, pady=(8, 4))
+        shown = tuple(placeholders)
+        if shown == self._inline_shown:
+            # 같은 placeholder 구성 -> layout/label/button 유지, entry 값만 갱신
+            for n, p in enumerate(shown):
+                ent = self._inline_row_pool[n][2]
+                ent.delete(0, tk.END)
+                ent.insert(0, str(obj["_params"].get(p, "")))
+            self.refresh_params_debounced()
+            return
 
-        for p in placeholders:
-            row = ttk.Frame(self.inline_box)
-            row.pack(anchor="w", padx=8, pady=3, fill=tk.X)
-            ttk.Label(row, text=p, width=14).pack(side=tk.LEFT)
+        self._hide_inline_widgets()
+        self._inline_header.pack(anchor="w", padx=8, pady=(8, 4))
+        self._inline_visible.append(self._inline_header)
 
-            ent = ttk.Entry(row, width=28)
+        for n, p in enumerate(placeholders):
+            row, lbl, ent, btn = self._inline_row(n)
+            lbl.configure(text=p)
+            ent.delete(0, tk.END)
             ent.insert(0, str(obj["_params"].get(p, "")))
-            ent.pack(side=tk.LEFT, padx=(6, 6))
-
-            ttk.Button(row, text="Apply", command=lambda k=p, e=ent: self.apply_inline_param(k, e.get())).pack(side=tk.LEFT)
+            btn.configure(command=lambda k=p, e=ent: self.apply_inline_param(k, e.get()))
+            row.pack(anchor="w", padx=8, pady=3, fill=tk.X)
+            self._inline_visible.append(row)
+        self._inline_shown = shown
 
-        self.refresh_params()
-        self.refresh_keyword_previews_only()
+        self.refresh_params_debounced()
 
     def apply_inline_param(self, key, value):
         obj = self._current_obj()
+        if key in obj["_params"] and obj["_params"][key] == value:
+            return
         obj["_params"][key] = value
-        self._persist_db(f"Param updated: {key}={value}")
-        self.refresh_params()
-        self.refresh_keyword_previews_only()
+        self._persist_db(f"Param updated: {key}={value}", vendor=self.vendor_var.get())
+        self.refresh_params_debounced(changed=key)
 
     # --------------------------------------------------------
     # Vendor delimiter
@@ -1786,8 +2562,6 @@ class KeywordGuideApp(tk.Tk):
         self._safe_tree_restore_selection(saved_sel, focus_iid=focus)
         self.on_keyword_select()
 
-        self._sync_vendor_scoped_config_with_db()
-
     # --------------------------------------------------------
     # Select All / Clear All
     # --------------------------------------------------------
@@ -1808,29 +2582,24 @@ class KeywordGuideApp(tk.Tk):
     # Bulk copy selected keywords
     # --------------------------------------------------------
     def _collect_selected_joined_templates(self) -> list[str]:
-        sel = list(self.tree.selection())
+        sel = self.tree.selection()
         if not sel:
             return []
 
-        try:
-            sel_sorted = sorted(sel, key=lambda x: int(x))
-        except Exception:
-            sel_sorted = sel
+        # iid -> int 변환 1회 후 int로 정렬 (정렬 key에서 재변환 X)
+        idxs = sorted(int(iid) for iid in sel if iid.isdigit())
 
-        obj = self._current_obj()
+        kws = self._current_obj()["_keywords"]
         v = self.vendor_var.get()
-        delim = self._get_vendor_delimiter(v)
+        delim = self._delim_cached(v)
+        joined = self._kw_joined
 
+        n = len(kws)
         joined_list = []
-        for iid in sel_sorted:
-            try:
-                idx = int(iid)
-            except Exception:
-                continue
-            if idx < 0 or idx >= len(obj["_keywords"]):
+        for idx in idxs:
+            if idx >= n:
                 continue
-            kw = obj["_keywords"][idx]
-            raw_joined = keyword_joined_template(kw, delim).strip()
+            raw_joined = joined(kws[idx], delim).strip()
             if raw_joined:
                 joined_list.append(raw_joined)
 
@@ -1845,21 +2614,18 @@ class KeywordGuideApp(tk.Tk):
         obj = self._current_obj()
         params = obj["_params"]
         v = self.vendor_var.get()
-        delim = self._get_vendor_delimiter(v)
+        delim = self._delim_cached(v)
 
-        rendered_list = []
-        for raw_joined in joined_list:
-            rendered = render_keyword(raw_joined, params).strip()
-            if rendered:
-                rendered_list.append(rendered)
+        # tree preview와 같은 (template, params key) memo 사용 -> 화면에 보이는 row는 cache hit
+        pkey = params_cache_key(params)
+        rendered_list = [r for r in (render_keyword_cached(j, pkey).strip() for j in joined_list) if r]
 
         if not rendered_list:
             self.log("No valid keywords to copy.")
             return
 
         combined = delim.join(rendered_list)
-        self.clipboard_clear()
-        self.clipboard_append(combined)
+        self._copy_to_clipboard(combined)
         self.log(f"Copied Selected ({len(rendered_list)}): {combined}")
 
     def copy_selected_keywords_no_params(self):
@@ -1869,16 +2635,12 @@ class KeywordGuideApp(tk.Tk):
             return
 
         v = self.vendor_var.get()
-        delim = self._get_vendor_delimiter(v)
+        delim = self._delim_cached(v)
 
-        rendered_list = []
-        for raw_joined in joined_list:
-            np = render_keyword_without_params(raw_joined).strip()
-            rendered_list.append(np)
+        rendered_list = [render_keyword_without_params(j).strip() for j in joined_list]
 
         combined = delim.join(rendered_list)
-        self.clipboard_clear()
-        self.clipboard_append(combined)
+        self._copy_to_clipboard(combined)
         self.log(f"Copied Selected NP ({len(rendered_list)}): {combined}")
 
     # --------------------------------------------------------
@@ -1897,7 +2659,7 @@ class KeywordGuideApp(tk.Tk):
         v = self.vendor_var.get()
         if not v:
             return
-        delim = self._get_vendor_delimiter(v)
+        delim = self._delim_cached(v)
         dlg = KeywordDialog(
             self,
             "Add Keyword",
@@ -1906,8 +2668,10 @@ class KeywordGuideApp(tk.Tk):
         )
         if dlg.result:
             obj = self._current_obj()
-            obj["_keywords"].append(dlg.result)
-            self._persist_db("Keyword added")
+            # 새 항목만 normalize (기존 항목/list 객체 유지 -> 전체 재정규화 X)
+            obj["_keywords"].extend(normalize_keywords([dlg.result]))
+            self._ref_params_memo.pop(id(obj["_keywords"]), None)
+            self._persist_db("Keyword added", vendor=self.vendor_var.get())
 
             self.refresh_keywords()
             new_iid = str(len(obj["_keywords"]) - 1)
@@ -1922,12 +2686,18 @@ class KeywordGuideApp(tk.Tk):
         kw = obj["_keywords"][idx]
 
         v = self.vendor_var.get()
-        delim = self._get_vendor_delimiter(v)
+        delim = self._delim_cached(v)
 
         dlg = KeywordDialog(self, "Edit Keyword", init=kw, delimiter=delim)
         if dlg.result:
-            obj["_keywords"][idx] = dlg.result
-            self._persist_db("Keyword edited")
+            norm = normalize_keywords([dlg.result])
+            if norm:
+                obj["_keywords"][idx] = norm[0]
+            else:
+                obj["_keywords"][idx] = dlg.result
+                self._invalidate_current_obj_cache()
+            self._ref_params_memo.pop(id(obj["_keywords"]), None)
+            self._persist_db("Keyword edited", vendor=self.vendor_var.get())
 
             saved = self._tree_selected_iids_sorted()
             focus = str(idx)
@@ -1941,7 +2711,8 @@ class KeywordGuideApp(tk.Tk):
 
         obj = self._current_obj()
         del obj["_keywords"][idx]
-        self._persist_db("Keyword removed")
+        self._ref_params_memo.pop(id(obj["_keywords"]), None)
+        self._persist_db("Keyword removed", vendor=self.vendor_var.get())
 
         self.refresh_keywords()
 
@@ -1957,6 +2728,21 @@ class KeywordGuideApp(tk.Tk):
     # --------------------------------------------------------
     # Up / Down (single selection only)
     # --------------------------------------------------------
+    def _swap_keyword_rows(self, a: int, b: int, sig):
+        # iid = row index -> 두 row의 values만 맞바꿈 (full refresh 없음). cache miss면 refresh로 fallback
+        self._clear_copy_feedback(force=True)
+        cache = self._tree_row_cache
+        ia, ib = str(a), str(b)
+        va, vb = cache.get(ia), cache.get(ib)
+        if va is None or vb is None or sig is None:
+            self.refresh_keywords()
+            return
+        self.tree.item(ia, values=vb)
+        self.tree.item(ib, values=va)
+        cache[ia], cache[ib] = vb, va
+        # swap은 list id/len을 유지 -> 이전 render sig 그대로 유효
+        self._last_render_sig = sig
+
     def move_keyword_up(self):
         sel = self._tree_selected_iids_sorted()
         if not sel:
@@ -1977,9 +2763,10 @@ class KeywordGuideApp(tk.Tk):
 
         kws[idx - 1], kws[idx] = kws[idx], kws[idx - 1]
         obj["_keywords"] = kws
-        self._persist_db("Keyword moved up")
+        sig = self._last_render_sig
+        self._persist_db("Keyword moved up", vendor=self.vendor_var.get())
 
-        self.refresh_keywords()
+        self._swap_keyword_rows(idx, idx - 1, sig)
         focus = str(idx - 1)
         self._safe_tree_restore_selection([focus], focus_iid=focus)
 
@@ -2003,9 +2790,10 @@ class KeywordGuideApp(tk.Tk):
 
         kws[idx + 1], kws[idx] = kws[idx], kws[idx + 1]
         obj["_keywords"] = kws
-        self._persist_db("Keyword moved down")
+        sig = self._last_render_sig
+        self._persist_db("Keyword moved down", vendor=self.vendor_var.get())
 
-        self.refresh_keywords()
+        self._swap_keyword_rows(idx, idx + 1, sig)
         focus = str(idx + 1)
         self._safe_tree_restore_selection([focus], focus_iid=focus)
 
@@ -2018,9 +2806,12 @@ class KeywordGuideApp(tk.Tk):
         if not row:
             return
 
-        if col == "#0":
+        if col == COL_CHECK:
             self._toggle_checkbox_row(row)
             return "break"
+        # Summary/Group/Preview 클릭은 처리할 게 없음 -> obj/template 조회 전에 반환
+        if col not in KEYWORD_ACTION_COLS:
+            return
 
         try:
             idx = int(row)
@@ -2035,10 +2826,10 @@ class KeywordGuideApp(tk.Tk):
         kw = obj["_keywords"][idx]
 
         v = self.vendor_var.get()
-        delim = self._get_vendor_delimiter(v)
-        raw_joined = keyword_joined_template(kw, delim)
+        delim = self._delim_cached(v)
+        raw_joined = self._kw_joined(kw, delim)
 
-        if col == "#3":  # Info
+        if col == COL_INFO:
             InfoPopup(
                 self,
                 title="Keyword Description",
@@ -2049,49 +2840,57 @@ class KeywordGuideApp(tk.Tk):
                 desc_rich=kw.get("desc_rich", None),
             )
 
-        elif col == "#4":  # Copy (with params)
-            rendered = render_keyword(raw_joined, params)
-            self.clipboard_clear()
-            self.clipboard_append(rendered)
+        elif col == COL_COPY:  # with params
+            rendered = render_keyword_cached(raw_joined, params_cache_key(params))
+            self._copy_to_clipboard(rendered)
             self._show_copy_feedback(row, which="copy")
             self.log(f"Copied: {rendered}")
 
-        elif col == "#5":  # CopyNP (without params)
+        elif col == COL_COPYNP:  # without params
             rendered = render_keyword_without_params(raw_joined)
-            self.clipboard_clear()
-            self.clipboard_append(rendered)
+            self._copy_to_clipboard(rendered)
             self._show_copy_feedback(row, which="copynp")
             self.log(f"Copied NP: {rendered}")
 
     def on_tree_double_click(self, event):
         col = self.tree.identify_column(event.x)
-        if col in ("#0", "#3", "#4", "#5"):
+        if col in KEYWORD_ACTION_COLS:
             return
         self.edit_keyword()
 
+    # --------------------------------------------------------
+    # Clipboard
+    # --------------------------------------------------------
+    def _copy_to_clipboard(self, text: str):
+        # Tk clipboard는 set 명령이 없음 -> clear + append 2회가 최소 (모든 copy 경로가 여기를 거침)
+        self.clipboard_clear()
+        self.clipboard_append(text)
+
     # --------------------------------------------------------
     # Copy feedback UI
     # --------------------------------------------------------
     def _show_copy_feedback(self, row_iid: str, which: str = "copy"):
-        self._clear_copy_feedback(force=True)
+        # 같은 row/같은 버튼 재클릭: 이미 "Copied" 표시 중 -> timer만 연장
+        if row_iid == self._copy_feedback_row and which == self._copy_feedback_which:
+            if self._copy_feedback_after_id is not None:
+                try:
+                    self.after_cancel(self._copy_feedback_after_id)
+                except Exception:
+                    pass
+            self._copy_feedback_after_id = self.after(COPY_FEEDBACK_MS, self._clear_copy_feedback)
+            return
 
-        try:
-            vals = list(self.tree.item(row_iid, "values"))
-            if len(vals) == len(KEYWORD_COLS):
-                if which == "copynp":
-                    vals[4] = "Copied"
-                else:
-                    vals[3] = "Copied"
-                self.tree.item(row_iid, values=tuple(vals))
-        except Exception:
-            pass
+        self._clear_copy_feedback(force=True)
 
+        # 해당 셀만 set()으로 갱신 (values 전체 round-trip 없음)
         try:
+            self.tree.set(row_iid, "copynp" if which == "copynp" else "copy", "Copied")
             self.tree.item(row_iid, tags=("copied",))
         except Exception:
             pass
 
         self._copy_feedback_row = row_iid
+        self._copy_feedback_which = which
         self._copy_feedback_after_id = self.after(COPY_FEEDBACK_MS, self._clear_copy_feedback)
 
     def _clear_copy_feedback(self, force=False):
@@ -2103,28 +2902,24 @@ class KeywordGuideApp(tk.Tk):
             self._copy_feedback_after_id = None
 
         row_iid = self._copy_feedback_row
+        which = self._copy_feedback_which
         self._copy_feedback_row = None
+        self._copy_feedback_which = None
         if not row_iid:
             return
 
+        # exists() 사전 확인 없음: 사라진 row면 Tcl error -> 무시
+        # row cache(원래 values)가 있으면 values + tags 복원을 item() 1회로
+        cached = self._tree_row_cache.get(row_iid)
         try:
-            exists = row_iid in self.tree.get_children("")
-        except Exception:
-            exists = False
-        if not exists:
-            return
-
-        try:
-            vals = list(self.tree.item(row_iid, "values"))
-            if len(vals) == len(KEYWORD_COLS):
-                vals[3] = "Copy"
-                vals[4] = "CopyNP"
-                self.tree.item(row_iid, values=tuple(vals))
-        except Exception:
-            pass
-
-        try:
-            self.tree.item(row_iid, tags=())
+            if cached is not None:
+                self.tree.item(row_iid, values=cached, tags=())
+            elif which == "copynp":
+                self.tree.set(row_iid, "copynp", "CopyNP")
+                self.tree.item(row_iid, tags=())
+            else:
+                self.tree.set(row_iid, "copy", "Copy")
+                self.tree.item(row_iid, tags=())
         except Exception:
             pass
 
@@ -2146,11 +2941,31 @@ class KeywordGuideApp(tk.Tk):
 
         val = simpledialog.askstring("Add Param", f"Value for {name}:") or ""
         obj["_params"][name] = val
-        self._persist_db("Param added")
+        self._persist_db("Param added", vendor=self.vendor_var.get())
 
-        self.refresh_params()
-        self._safe_param_restore_selection(name)
-        self.refresh_keyword_previews_only()
+        self.refresh_params_debounced(select=name, changed=name)
+
+    def add_params_bulk(self):
+        dlg = BulkParamDialog(self)
+        if not dlg.result:
+            return
+        entries = parse_param_lines(dlg.result)
+        if not entries:
+            return
+
+        # 모든 줄을 먼저 적용 -> persist/refresh는 마지막에 1회
+        params = self._current_obj()["_params"]
+        changed = [k for k, val in entries.items() if params.get(k) != val]
+        if not changed:
+            self.log("Params bulk add: no changes.")
+            return
+        for k in changed:
+            params[k] = entries[k]
+        self._persist_db(f"Params bulk added ({len(changed)})", vendor=self.vendor_var.get())
+
+        # idle refresh 1회로 합쳐짐 (선택은 마지막 param)
+        for k in changed:
+            self.refresh_params_debounced(select=k, changed=k)
 
     def remove_param(self):
         sel = self.param_tree.selection()
@@ -2166,10 +2981,9 @@ class KeywordGuideApp(tk.Tk):
             return
 
         del obj["_params"][pname]
-        self._persist_db("Param removed")
+        self._persist_db("Param removed", vendor=self.vendor_var.get())
 
-        self.refresh_params()
-        self.refresh_keyword_previews_only()
+        self.refresh_params_debounced(changed=pname)
 
     # --------------------------------------------------------
     # Param in-place edit
@@ -2191,7 +3005,12 @@ class KeywordGuideApp(tk.Tk):
         obj = self._current_obj()
         val = str(obj["_params"].get(row, ""))
 
-        e = ttk.Entry(self.param_tree)
+        e = self._param_editor_entry
+        if e is None:
+            e = self._param_editor_entry = ttk.Entry(self.param_tree)
+            e.bind("<Return>", lambda _: self._commit_param_edit())
+            e.bind("<Escape>", lambda _: self._cancel_param_edit())
+        e.delete(0, tk.END)
         e.insert(0, val)
         e.place(x=x, y=y, width=w, height=h)
         e.focus_set()
@@ -2200,9 +3019,6 @@ class KeywordGuideApp(tk.Tk):
         self._param_editor = e
         self._param_editing = row
 
-        e.bind("<Return>", lambda _: self._commit_param_edit())
-        e.bind("<Escape>", lambda _: self._cancel_param_edit())
-
     def _commit_param_edit(self):
         if not self._param_editor or not self._param_editing:
             return
@@ -2211,18 +3027,19 @@ class KeywordGuideApp(tk.Tk):
         new_val = self._param_editor.get()
 
         obj = self._current_obj()
+        if editing_key in obj["_params"] and obj["_params"][editing_key] == new_val:
+            self._cancel_param_edit()
+            return
         obj["_params"][editing_key] = new_val
-        self._persist_db(f"Param updated: {editing_key}={new_val}")
+        self._persist_db(f"Param updated: {editing_key}={new_val}", vendor=self.vendor_var.get())
 
         self._cancel_param_edit()
-        self.refresh_params()
-        self._safe_param_restore_selection(editing_key)
-        self.refresh_keyword_previews_only()
+        self.refresh_params_debounced(select=editing_key, changed=editing_key)
 
     def _cancel_param_edit(self):
         if self._param_editor:
             try:
-                self._param_editor.destroy()
+                self._param_editor.place_forget()
             except Exception:
                 pass
         self._param_editor = None
@@ -2256,10 +3073,9 @@ class KeywordGuideApp(tk.Tk):
             return
 
         self.db[v][i][name] = {"_keywords": [], "_params": {}}
-        self._persist_db("Category added")
+        self._persist_db("Category added", vendor=v)
 
-        restore = (v, i, name)
-        self.build_nav_tree(select_default=True, restore_path=restore)
+        self.refresh_nav_details(v, i, name)
 
     def delete_category(self):
         v, i, d = self.vendor_var.get(), self.issue_var.get(), self.detail_var.get()
@@ -2275,11 +3091,12 @@ class KeywordGuideApp(tk.Tk):
             del self.db[v][i][d]
         except Exception:
             return
-        self._persist_db("Category deleted")
+        self._invalidate_obj_cache(v, i, d)
+        self._persist_db("Category deleted", vendor=v)
 
-        details = list(self.db[v][i].keys())
-        new_d = "_COMMON" if "_COMMON" in details else (details[0] if details else "_COMMON")
-        self.build_nav_tree(select_default=True, restore_path=(v, i, new_d))
+        details = self.db[v][i]
+        new_d = "_COMMON" if "_COMMON" in details else next(iter(details), "_COMMON")
+        self.refresh_nav_details(v, i, new_d)
 
     def rename_category(self):
         v, i, d = self.vendor_var.get(), self.issue_var.get(), self.detail_var.get()
@@ -2301,9 +3118,10 @@ class KeywordGuideApp(tk.Tk):
             return
 
         self.db[v][i][new] = self.db[v][i].pop(d)
-        self._persist_db("Category renamed")
+        self._invalidate_obj_cache(v, i, d)
+        self._persist_db("Category renamed", vendor=v)
 
-        self.build_nav_tree(select_default=True, restore_path=(v, i, new))
+        self.refresh_nav_details(v, i, new)
 
     # --------------------------------------------------------
     # Vendor CRUD (NEW)
@@ -2331,7 +3149,7 @@ class KeywordGuideApp(tk.Tk):
             self.db[name][issue] = self._default_issue_obj()
 
         # vendor-scoped issue_cfg entry 생성
-        self.issue_cfg = ensure_issue_config_vendor_scoped(self.issue_cfg, list(self.db.keys()))
+        self._ensure_issue_cfg()
         self._set_vendor_issues(name, list(base_issues))
         self._set_vendor_delimiter(name, DEFAULT_DELIMITER)
 
@@ -2384,7 +3202,8 @@ class KeywordGuideApp(tk.Tk):
         except Exception:
             pass
 
-        self.issue_cfg = ensure_issue_config_vendor_scoped(self.issue_cfg, list(self.db.keys()))
+        self._ensure_issue_cfg()
+        self._invalidate_obj_cache(v)
         self._persist_db(f"Vendor deleted: {v}")
         self._persist_issues(f"Vendor config deleted: {v}")
 
@@ -2458,7 +3277,8 @@ class KeywordGuideApp(tk.Tk):
         except Exception:
             pass
 
-        self.issue_cfg = ensure_issue_config_vendor_scoped(self.issue_cfg, list(self.db.keys()))
+        self._ensure_issue_cfg()
+        self._invalidate_obj_cache(v)
         self._persist_db(f"Vendor renamed: {v} -> {new}")
         self._persist_issues(f"Vendor config renamed: {v} -> {new}")
 
@@ -2493,18 +3313,20 @@ class KeywordGuideApp(tk.Tk):
         if not name:
             return
 
-        issues = self._get_vendor_issues(v)
-        if name in issues:
+        iset = self._vendor_issue_set(v)
+        if name in iset:
             messagebox.showwarning("Warning", "Issue already exists for this vendor.")
             return
 
+        issues = self._get_vendor_issues(v)
         issues.append(name)
-        self._set_vendor_issues(v, issues)
+        iset.add(name)
+        self._set_vendor_issues(v, issues, iset)
         self._persist_issues(f"Issue added for {v}")
 
         self.db.setdefault(v, {})
         self.db[v].setdefault(name, self._default_issue_obj())
-        self._persist_db(f"DB synced (issue added) for {v}")
+        self._persist_db(f"DB synced (issue added) for {v}", vendor=v)
 
         self.build_nav_tree(select_default=True, restore_path=(v, name, "_COMMON"))
 
@@ -2515,10 +3337,11 @@ class KeywordGuideApp(tk.Tk):
             messagebox.showinfo("Info", "Issue를 먼저 선택하세요.")
             return
 
-        issues = self._get_vendor_issues(v)
-        if cur not in issues:
+        iset = self._vendor_issue_set(v)
+        if cur not in iset:
             return
 
+        issues = self._vendor_issues_live(v)
         if len(issues) <= 1:
             messagebox.showinfo("Info", "At least one issue must remain for this vendor.")
             return
@@ -2526,13 +3349,16 @@ class KeywordGuideApp(tk.Tk):
         if not messagebox.askyesno("Confirm", f"Delete issue '{cur}' for vendor '{v}'?"):
             return
 
-        issues = [x for x in issues if x != cur]
-        self._set_vendor_issues(v, issues)
+        # iset membership 확인됨 -> cfg list에 반드시 존재 (ValueError 불가)
+        issues.remove(cur)
+        iset.discard(cur)
+        self._set_vendor_issues(v, issues, iset)
         self._persist_issues(f"Issue deleted for {v}")
 
         if isinstance(self.db.get(v), dict) and cur in self.db[v]:
             del self.db[v][cur]
-        self._persist_db(f"DB synced (issue deleted) for {v}")
+        self._invalidate_obj_cache(v, cur)
+        self._persist_db(f"DB synced (issue deleted) for {v}", vendor=v)
 
         new_issue = issues[0]
         self.build_nav_tree(select_default=True, restore_path=(v, new_issue, "_COMMON"))
@@ -2544,8 +3370,8 @@ class KeywordGuideApp(tk.Tk):
             messagebox.showinfo("Info", "Issue를 먼저 선택하세요.")
             return
 
-        issues = self._get_vendor_issues(v)
-        if cur not in issues:
+        iset = self._vendor_issue_set(v)
+        if cur not in iset:
             return
 
         new = simpledialog.askstring("Rename Issue", "New issue name:", initialvalue=cur)
@@ -2556,12 +3382,15 @@ class KeywordGuideApp(tk.Tk):
             return
         if new == cur:
             return
-        if new in issues:
+        if new in iset:
             messagebox.showwarning("Warning", "Issue already exists for this vendor.")
             return
 
-        issues = [new if x == cur else x for x in issues]
-        self._set_vendor_issues(v, issues)
+        issues = self._vendor_issues_live(v)
+        issues[issues.index(cur)] = new
+        iset.discard(cur)
+        iset.add(new)
+        self._set_vendor_issues(v, issues, iset)
         self._persist_issues(f"Issue renamed for {v}")
 
         self.db.setdefault(v, {})
@@ -2569,7 +3398,8 @@ class KeywordGuideApp(tk.Tk):
             self.db[v][new] = self.db[v].pop(cur)
         else:
             self.db[v][new] = self._default_issue_obj()
-        self._persist_db(f"DB synced (issue renamed) for {v}")
+        self._invalidate_obj_cache(v, cur)
+        self._persist_db(f"DB synced (issue renamed) for {v}", vendor=v)
 
         self.build_nav_tree(select_default=True, restore_path=(v, new, "_COMMON"))
 
@@ -2652,11 +3482,20 @@ class KeywordGuideApp(tk.Tk):
                 self.ui_state = new_ui
 
             self._sync_vendor_scoped_config_with_db()
-
-            save_json(DB_PATH, self.db)
-            save_json(ISSUES_PATH, self.issue_cfg)
+            self._last_render_sig = None
+            self._join_cache.clear()
+            self._delim_cache.clear()
+            self._obj_cache.clear()
+            self._normalized_kws.clear()
+            self._ref_params_memo.clear()
+
+            self._db_dirty = True
+            self._db_dirty_vendors = None
+            self._cfg_dirty = True
+            self._flush_pending_saves()
             if isinstance(self.ui_state, dict):
-                save_json(UI_STATE_PATH, self.ui_state)
+                self._enqueue_write(UI_STATE_PATH, _json_dumps_bytes(self.ui_state), "UI state")
+                self._ui_state_saved = dict(self.ui_state)
 
             self._apply_saved_widths()
             self.build_nav_tree(select_default=True, restore_path=None)
@@ -2671,7 +3510,7 @@ class KeywordGuideApp(tk.Tk):
     def _apply_saved_widths(self):
         cols = self.ui_state.get("keyword_tree_cols", {}) if isinstance(self.ui_state, dict) else {}
         for c, w in cols.items():
-            if c in DEFAULT_KEYWORD_COL_WIDTHS and c in KEYWORD_COLS:
+            if c in KEYWORD_WIDTH_COLS:
                 try:
                     self.tree.column(c, width=int(w))
                 except Exception:
@@ -2693,9 +3532,8 @@ class KeywordGuideApp(tk.Tk):
 
     def reset_ui_layout(self):
         self.geometry(DEFAULT_GEOMETRY)
-        for c, w in DEFAULT_KEYWORD_COL_WIDTHS.items():
-            if c in KEYWORD_COLS:
-                self.tree.column(c, width=w)
+        for c in KEYWORD_WIDTH_COLS:
+            self.tree.column(c, width=DEFAULT_KEYWORD_COL_WIDTHS[c])
         try:
             self.tree.column("#0", width=34)
         except Exception:
@@ -2722,6 +3560,9 @@ class KeywordGuideApp(tk.Tk):
         self._persist_ui_state("UI state saved", state)
         self._persist_db("DB saved")
         self._persist_issues("Issue config saved")
+        self._cancel_pending_param_refresh()
+        self._flush_pending_saves()
+        self._stop_writer()
         self.destroy()
 
 